@@ -1,28 +1,40 @@
 #!/usr/bin/env python3
 """Script to consolidate duplicate store entries."""
 
-import asyncio
 import sys
 from pathlib import Path
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).parent.parent
+# Add src to path so this runs without installing the package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
 
 from groceries.database.connection import get_pool, close_pool
+from groceries.utils.event_loop import run
 
 
 async def consolidate_stores(keep_store_id: int, delete_store_id: int, dry_run: bool = True):
     """Consolidate two stores by moving deals from one to another and deleting the duplicate."""
-    pool = await get_pool()
+    # A single connection is all this script needs
+    pool = await get_pool(min_size=1, max_size=2)
     
     try:
         async with pool.acquire() as conn:
             # Start a transaction
             async with conn.transaction():
-                # Get store info
-                keep_store = await conn.fetchrow('SELECT * FROM stores WHERE id = $1', keep_store_id)
-                delete_store = await conn.fetchrow('SELECT * FROM stores WHERE id = $1', delete_store_id)
+                # Get both stores and their deal counts in one round-trip
+                rows = await conn.fetch(
+                    """
+                    SELECT s.id, s.name, COUNT(gd.id) AS deal_count
+                    FROM stores s
+                    LEFT JOIN grocery_deals gd ON gd.store_id = s.id
+                    WHERE s.id = ANY($1::int[])
+                    GROUP BY s.id, s.name
+                    """,
+                    [keep_store_id, delete_store_id]
+                )
+                stores = {row['id']: row for row in rows}
+                keep_store = stores.get(keep_store_id)
+                delete_store = stores.get(delete_store_id)
                 
                 if not keep_store:
                     print(f"❌ Store with ID {keep_store_id} not found")
@@ -36,13 +48,8 @@ async def consolidate_stores(keep_store_id: int, delete_store_id: int, dry_run:
                 print(f"   Keep: ID {keep_store_id} - '{keep_store['name']}'")
                 print(f"   Delete: ID {delete_store_id} - '{delete_store['name']}'")
                 
-                # Count deals in each store
-                keep_deals_count = await conn.fetchval(
-                    'SELECT COUNT(*) FROM grocery_deals WHERE store_id = $1', keep_store_id
-                )
-                delete_deals_count = await conn.fetchval(
-                    'SELECT COUNT(*) FROM grocery_deals WHERE store_id = $1', delete_store_id
-                )
+                keep_deals_count = keep_store['deal_count']
+                delete_deals_count = delete_store['deal_count']
                 
                 print(f"   Deals in keep store: {keep_deals_count}")
                 print(f"   Deals in delete store: {delete_deals_count}")
@@ -53,13 +60,15 @@ async def consolidate_stores(keep_store_id: int, delete_store_id: int, dry_run:
                     print("   Would delete store: ", delete_store_id)
                     return True
                 
-                # Update all deals from delete_store to keep_store
+                # Update all deals from delete_store to keep_store. This must be its own
+                # statement before the DELETE: grocery_deals.store_id is ON DELETE CASCADE.
                 if delete_deals_count > 0:
-                    updated = await conn.execute(
+                    status = await conn.execute(
                         'UPDATE grocery_deals SET store_id = $1 WHERE store_id = $2',
                         keep_store_id, delete_store_id
                     )
-                    print(f"✅ Updated {delete_deals_count} deals to point to store {keep_store_id}")
+                    moved = int(status.split()[-1])
+                    print(f"✅ Updated {moved} deals to point to store {keep_store_id}")
                 
                 # Delete the duplicate store
                 await conn.execute('DELETE FROM stores WHERE id = $1', delete_store_id)
@@ -107,5 +116,5 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run(main())
 
@@ -1,123 +1,15 @@
 #!/usr/bin/env python3
-"""
-Scrape grocery deals from various stores.
+"""Scrape grocery deals from one or all stores (entry point for groceries.scrapers.runner)."""
 
-This is a framework for scraping weekly grocery deals. Each store
-should have its own scraper implementation.
-"""
-
-import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+# Add src to path so this runs without installing the package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
 
-from groceries.services.store_service import StoreService
-from groceries.models.grocery import GroceryDeal, Store
-from scripts.processing.base_scraper import BaseGroceryScraper
-from scripts.processing.scrape_hmart import HmartScraper
-from scripts.processing.scrape_stew_leonards import StewLeonardsScraper
-
-
-class ExampleScraper(BaseGroceryScraper):
-    """
-    Example scraper implementation.
-    
-    This is a template for creating store-specific scrapers.
-    Replace this with actual scraping logic for each store.
-    """
-    
-    async def scrape_deals(self) -> list[GroceryDeal]:
-        """
-        Scrape deals from the store.
-        
-        This is where you would implement the actual web scraping logic
-        using BeautifulSoup, Selenium, or API calls.
-        
-        Returns:
-            List of GroceryDeal objects
-        """
-        # Example: This would be replaced with actual scraping logic
-        # For now, return empty list as placeholder
-        deals = []
-        
-        # Example deal structure:
-        # deal = GroceryDeal(
-        #     store_id=self.store.id,
-        #     product_name="Organic Milk",
-        #     regular_price=Decimal("5.99"),
-        #     sale_price=Decimal("4.99"),
-        #     unit="gallon",
-        #     quantity=Decimal("1"),
-        #     valid_from=date.today(),
-        #     valid_to=date(2025, 1, 7),
-        #     source_url="https://example.com/deal/123",
-        #     description="Organic whole milk on sale"
-        # )
-        # deals.append(deal)
-        
-        return deals
-
-
-async def scrape_store(store_name: str, scraper_class: type[BaseGroceryScraper]):
-    """
-    Scrape deals from a specific store.
-    
-    Args:
-        store_name: Name of the store
-        scraper_class: Scraper class to use
-    """
-    scraper = scraper_class(store_name=store_name, output_dir=store_name.lower().replace(' ', '_'))
-    saved_paths = await scraper.run()
-    return saved_paths
-
-
-async def main():
-    """Main entry point for the scraper."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='Scrape grocery deals from stores')
-    parser.add_argument('--store', type=str, help='Store name to scrape')
-    parser.add_argument('--all', action='store_true', help='Scrape all stores')
-    
-    args = parser.parse_args()
-    
-    # Map store names to scraper classes
-    scraper_map = {
-        'Hmart': HmartScraper,
-        'hmart': HmartScraper,
-        'Stew Leonards': StewLeonardsScraper,
-        'Stew Leonard\'s': StewLeonardsScraper,
-        'stew leonards': StewLeonardsScraper,
-        'stew leonard\'s': StewLeonardsScraper,
-    }
-    
-    if args.all:
-        # Scrape all stores
-        stores = ['Stop and Shop', 'Hmart', 'Stew Leonards', 'Foodtown', 'Costco', "Decicco's"]
-        for store_name in stores:
-            try:
-                print(f"\n{'='*60}")
-                print(f"Scraping {store_name}")
-                print(f"{'='*60}")
-                scraper_class = scraper_map.get(store_name, ExampleScraper)
-                scraper = scraper_class(store_name=store_name, output_dir=store_name.lower().replace(' ', '_'))
-                await scraper.run()
-            except Exception as e:
-                print(f"❌ Error scraping {store_name}: {e}")
-    elif args.store:
-        # Scrape specific store
-        scraper_class = scraper_map.get(args.store, ExampleScraper)
-        scraper = scraper_class(store_name=args.store, output_dir=args.store.lower().replace(' ', '_'))
-        await scraper.run()
-    else:
-        parser.print_help()
-
+from groceries.scrapers.runner import main
+from groceries.utils.event_loop import run
 
 if __name__ == '__main__':
-    asyncio.run(main())
-
+    run(main())
@@ -7,45 +7,47 @@ Usage:
 """
 
 import asyncio
-import json
-import sys
 from pathlib import Path
 from typing import Optional
 import argparse
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+import orjson
 
-import aiofiles
 
+# Maximum number of files read and rewritten at once
+UPDATE_CONCURRENCY = 32
 
-async def update_json_file(file_path: Path, old_store_id: int, new_store_id: int, dry_run: bool = False) -> bool:
-    """Update store_id in a single JSON file."""
+
+async def update_json_file(file_path: Path, old_store_id: int, new_store_id: int, dry_run: bool = False) -> str:
+    """
+    Update store_id in a single JSON file.
+    
+    Returns:
+        'updated' if the store_id was replaced, 'skipped' if it already has the
+        new store_id, or 'failed' for any other store_id or an error
+    """
     try:
-        # Read the file
-        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-            content = await f.read()
+        # Read the file in a worker thread
+        content = await asyncio.to_thread(file_path.read_bytes)
         
-        data = json.loads(content)
+        data = orjson.loads(content)
         
         # Check if store_id needs updating
-        if data.get('store_id') != old_store_id:
-            return False  # No update needed
+        store_id = data.get('store_id')
+        if store_id != old_store_id:
+            return 'skipped' if store_id == new_store_id else 'failed'
         
         # Update store_id
         data['store_id'] = new_store_id
         
         if not dry_run:
             # Write back to file
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+            await asyncio.to_thread(file_path.write_bytes, orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
-        return True
+        return 'updated'
     except Exception as e:
         print(f"  ❌ Error updating {file_path.name}: {e}")
-        return False
+        return 'failed'
 
 
 async def update_directory(directory: str, old_store_id: int, new_store_id: int, dry_run: bool = False):
@@ -69,37 +71,25 @@ async def update_directory(directory: str, old_store_id: int, new_store_id: int,
     print(f"🔄 Updating store_id from {old_store_id} to {new_store_id}")
     print()
     
-    updated = 0
-    skipped = 0
-    failed = 0
+    counts = {'updated': 0, 'skipped': 0, 'failed': 0}
+    semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
     
-    for idx, json_file in enumerate(json_files, 1):
+    async def update(json_file: Path):
+        async with semaphore:
+            result = await update_json_file(json_file, old_store_id, new_store_id, dry_run=dry_run)
+        counts[result] += 1
+        idx = sum(counts.values())
         if idx % 10 == 0 or idx == len(json_files):
-            print(f"[{idx}/{len(json_files)}] Processing: {json_file.name}")
-        
-        success = await update_json_file(json_file, old_store_id, new_store_id, dry_run=dry_run)
-        
-        if success:
-            updated += 1
-        else:
-            # Check if it was skipped (already correct) or failed
-            try:
-                async with aiofiles.open(json_file, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                data = json.loads(content)
-                if data.get('store_id') == new_store_id:
-                    skipped += 1
-                else:
-                    failed += 1
-            except:
-                failed += 1
+            print(f"[{idx}/{len(json_files)}] Processed: {json_file.name}")
+    
+    await asyncio.gather(*(update(json_file) for json_file in json_files))
     
     print()
     print("=" * 60)
     print("📊 Summary:")
-    print(f"  ✅ Updated: {updated}")
-    print(f"  ℹ️  Skipped (already correct): {skipped}")
-    print(f"  ❌ Failed: {failed}")
+    print(f"  ✅ Updated: {counts['updated']}")
+    print(f"  ℹ️  Skipped (already correct): {counts['skipped']}")
+    print(f"  ❌ Failed: {counts['failed']}")
     print(f"  📁 Total files: {len(json_files)}")
     print("=" * 60)
 
@@ -21,10 +21,11 @@ setup(
         "pydantic>=2.5.0",
         "python-dotenv>=1.0.0",
         "click>=8.1.0",
-        "aiofiles>=23.2.0",
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
         "beautifulsoup4>=4.12.0",
         "lxml>=5.0.0",
+        "orjson>=3.9.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
     ],
     entry_points={
         "console_scripts": [
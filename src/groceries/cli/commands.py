@@ -1,19 +1,11 @@
 """Command-line interface commands."""
 
-import asyncio
 import click
-import json
 from typing import Optional
-from pathlib import Path
-from datetime import date
-from decimal import Decimal
 
-from ..database import test_connection, close_pool, get_pool
-from ..services.grocery_service import GroceryService
-from ..services.store_service import StoreService
-from ..services.category_service import CategoryService
-from ..models.grocery import GroceryDeal
-from ..utils.json_processor import JSONProcessor
+# Database, service and model imports live inside the commands, so --help
+# and argument errors don't pay for asyncpg and pydantic
+from ..utils.event_loop import run
 
 
 @click.group()
@@ -25,11 +17,12 @@ def main():
 @main.command()
 def test_db():
     """Test database connection."""
-    asyncio.run(_test_db())
+    run(_test_db())
 
 
 async def _test_db():
     """Test database connection."""
+    from ..database import test_connection, close_pool
     try:
         success = await test_connection()
         if success:
@@ -45,31 +38,22 @@ async def _test_db():
 @click.argument('json_file_path')
 def load_deal(json_file_path: str):
     """Load a grocery deal JSON file into the database."""
-    asyncio.run(_load_deal(json_file_path))
+    run(_load_deal(json_file_path))
 
 
 async def _load_deal(json_file_path: str):
     """Load a grocery deal JSON file into the database."""
+    from ..database import close_pool
+    from ..services.grocery_service import GroceryService
+    from ..models.grocery import GroceryDeal
+    from ..utils.json_processor import JSONProcessor
     try:
         click.echo(f"💾 Loading deal from {json_file_path}...")
         
         processor = JSONProcessor()
         deal_data = await processor.load_deal_json(json_file_path)
         
-        # Convert date strings to date objects
-        if 'valid_from' in deal_data and isinstance(deal_data['valid_from'], str):
-            deal_data['valid_from'] = date.fromisoformat(deal_data['valid_from'])
-        if 'valid_to' in deal_data and isinstance(deal_data['valid_to'], str):
-            deal_data['valid_to'] = date.fromisoformat(deal_data['valid_to'])
-        
-        # Convert Decimal strings to Decimal
-        for price_field in ['regular_price', 'sale_price', 'quantity', 'discount_percentage']:
-            if price_field in deal_data and deal_data[price_field] is not None:
-                if isinstance(deal_data[price_field], str):
-                    deal_data[price_field] = Decimal(deal_data[price_field])
-                elif isinstance(deal_data[price_field], float):
-                    deal_data[price_field] = Decimal(str(deal_data[price_field]))
-        
+        # Pydantic coerces the ISO date and price strings/floats itself
         deal = GroceryDeal.model_validate(deal_data)
         
         created_deal = await GroceryService.create(deal)
@@ -95,14 +79,16 @@ async def _load_deal(json_file_path: str):
 @click.option('--store', type=str, help='Filter by store name')
 def list_deals(limit: int, store: Optional[str]):
     """List recent deals from the database."""
-    asyncio.run(_list_deals(limit, store))
+    run(_list_deals(limit, store))
 
 
 async def _list_deals(limit: int, store: Optional[str]):
     """List recent deals."""
+    from ..database import close_pool
+    from ..services.grocery_service import GroceryService
+    from ..services.store_service import StoreService
+    from ..models.grocery import GroceryDealFilters
     try:
-        from ..models.grocery import GroceryDealFilters
-        
         filters = None
         if store:
             store_obj = await StoreService.get_by_id(int(store)) if store.isdigit() else None
@@ -115,24 +101,26 @@ async def _list_deals(limit: int, store: Optional[str]):
                     click.echo(f"⚠️  Store '{store}' not found. Showing all deals.")
         
         click.echo(f"📋 Fetching {limit} recent deals...")
-        deals = await GroceryService.get_all(filters=filters, limit=limit)
-        
-        if not deals:
-            click.echo("📭 No deals found in database")
-            return
-        
-        for i, deal in enumerate(deals, 1):
-            click.echo(f"{i}. {deal.product_name}")
+        # Print each deal as the cursor yields it
+        count = 0
+        async for deal in GroceryService.iter_all(filters=filters, limit=limit):
+            count += 1
+            # One write per deal instead of one per line
+            lines = [f"{count}. {deal.product_name}"]
             if deal.store:
-                click.echo(f"   🏪 Store: {deal.store.name}")
+                lines.append(f"   🏪 Store: {deal.store.name}")
             if deal.sale_price:
-                click.echo(f"   💰 Sale Price: ${deal.sale_price}")
+                lines.append(f"   💰 Sale Price: ${deal.sale_price}")
                 if deal.regular_price:
-                    click.echo(f"   💵 Regular Price: ${deal.regular_price}")
+                    lines.append(f"   💵 Regular Price: ${deal.regular_price}")
             if deal.discount_percentage:
-                click.echo(f"   🎯 Discount: {deal.discount_percentage}%")
-            click.echo(f"   📅 Valid: {deal.valid_from} to {deal.valid_to}")
-            click.echo()
+                lines.append(f"   🎯 Discount: {deal.discount_percentage}%")
+            lines.append(f"   📅 Valid: {deal.valid_from} to {deal.valid_to}")
+            lines.append("")
+            click.echo("\n".join(lines))
+        
+        if not count:
+            click.echo("📭 No deals found in database")
     except Exception as e:
         click.echo(f"❌ Error listing deals: {str(e)}")
         import traceback
@@ -147,11 +135,13 @@ async def _list_deals(limit: int, store: Optional[str]):
 @click.option('--limit', default=10, help='Number of results to show')
 def search_deals(search_term: str, limit: int):
     """Search deals by product name."""
-    asyncio.run(_search_deals(search_term, limit))
+    run(_search_deals(search_term, limit))
 
 
 async def _search_deals(search_term: str, limit: int):
     """Search deals."""
+    from ..database import close_pool
+    from ..services.grocery_service import GroceryService
     try:
         click.echo(f"🔍 Searching for '{search_term}'...")
         deals = await GroceryService.search(search_term, limit=limit)
@@ -160,14 +150,16 @@ async def _search_deals(search_term: str, limit: int):
             click.echo("📭 No deals found")
             return
         
-        click.echo(f"✅ Found {len(deals)} deals:")
+        # Build the whole report and write it once
+        lines = [f"✅ Found {len(deals)} deals:"]
         for i, deal in enumerate(deals, 1):
-            click.echo(f"{i}. {deal.product_name}")
+            lines.append(f"{i}. {deal.product_name}")
             if deal.store:
-                click.echo(f"   🏪 Store: {deal.store.name}")
+                lines.append(f"   🏪 Store: {deal.store.name}")
             if deal.sale_price:
-                click.echo(f"   💰 Sale Price: ${deal.sale_price}")
-            click.echo()
+                lines.append(f"   💰 Sale Price: ${deal.sale_price}")
+            lines.append("")
+        click.echo("\n".join(lines))
     except Exception as e:
         click.echo(f"❌ Error searching deals: {str(e)}")
         exit(1)
@@ -178,11 +170,13 @@ async def _search_deals(search_term: str, limit: int):
 @main.command()
 def stats():
     """Show database statistics."""
-    asyncio.run(_stats())
+    run(_stats())
 
 
 async def _stats():
     """Show statistics."""
+    from ..database import close_pool
+    from ..services.grocery_service import GroceryService
     try:
         stats = await GroceryService.get_stats()
         
@@ -209,23 +203,37 @@ async def _stats():
 @click.argument('directory', type=str, required=False, default='data/stage')
 @click.option('--dry-run', is_flag=True, help='Validate files without loading to database')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed output for each file')
-def load_directory(directory: str, dry_run: bool, verbose: bool):
+@click.option('--per-file', is_flag=True, help='Insert one deal at a time instead of in bulk')
+@click.option('--force', is_flag=True, help='Reload files that were already loaded')
+@click.option('--limit', type=int, help='Only consider the first N files found')
+def load_directory(
+    directory: str,
+    dry_run: bool,
+    verbose: bool,
+    per_file: bool,
+    force: bool,
+    limit: Optional[int]
+):
     """Load all JSON files from a directory into the database."""
-    asyncio.run(_load_directory(directory, dry_run, verbose))
+    run(_load_directory(directory, dry_run, verbose, per_file, force, limit))
 
 
-async def _load_directory(directory: str, dry_run: bool, verbose: bool):
+async def _load_directory(
+    directory: str,
+    dry_run: bool,
+    verbose: bool,
+    per_file: bool = False,
+    force: bool = False,
+    limit: Optional[int] = None
+):
     """Load directory of JSON files."""
-    import sys
-    from pathlib import Path
-    
-    PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-    sys.path.insert(0, str(PROJECT_ROOT))
-    sys.path.insert(0, str(PROJECT_ROOT / 'scripts' / 'processing'))
-    
+    from ..database import close_pool
     try:
-        from scripts.processing.load_json_to_db import load_directory
-        await load_directory(directory, dry_run=dry_run, verbose=verbose)
+        from ..loaders.json_loader import load_directory
+        await load_directory(
+            directory, dry_run=dry_run, verbose=verbose, per_file=per_file, force=force,
+            limit=limit
+        )
     except Exception as e:
         click.echo(f"❌ Error loading directory: {str(e)}")
         import traceback
@@ -239,78 +247,45 @@ async def _load_directory(directory: str, dry_run: bool, verbose: bool):
 @click.option('--store', type=str, help='Store name to scrape')
 @click.option('--url', type=str, help='Specific URL to scrape (for stores that support it)')
 @click.option('--all', is_flag=True, help='Scrape all stores')
-def scrape(store: Optional[str], url: Optional[str], all: bool):
+@click.option('--ndjson', is_flag=True, help='Save each run as one NDJSON file instead of one JSON per deal')
+def scrape(store: Optional[str], url: Optional[str], all: bool, ndjson: bool):
     """Scrape deals from stores."""
-    asyncio.run(_scrape(store, url, all))
+    run(_scrape(store, url, all, ndjson))
 
 
-async def _scrape(store: Optional[str], url: Optional[str], all: bool):
+async def _scrape(store: Optional[str], url: Optional[str], all: bool, ndjson: bool = False):
     """Scrape deals."""
-    import sys
-    from pathlib import Path
-    
-    PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-    scripts_path = PROJECT_ROOT / 'scripts' / 'processing'
-    sys.path.insert(0, str(PROJECT_ROOT))
-    
     try:
+        from ..scrapers import runner as scraper_module
+        
         if all:
             click.echo("🔍 Scraping all stores...")
-            # Import and run the scraper
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "scrape_grocery_deals",
-                scripts_path / "scrape_grocery_deals.py"
-            )
-            scraper_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(scraper_module)
-            await scraper_module.main()
+            await scraper_module.scrape_all_stores(ndjson=ndjson)
         elif store:
             click.echo(f"🔍 Scraping {store}...")
             if url:
                 click.echo(f"📍 Using URL: {url}")
             
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "scrape_grocery_deals",
-                scripts_path / "scrape_grocery_deals.py"
-            )
-            scraper_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(scraper_module)
             
             # Use appropriate scraper based on store name
-            scraper_class = scraper_module.ExampleScraper
-            store_lower = store.lower()
+            scraper_class = scraper_module.get_scraper_class(store)
             
-            if store_lower in ['hmart', 'h-mart']:
-                # Import Hmart scraper
-                hmart_spec = importlib.util.spec_from_file_location(
-                    "scrape_hmart",
-                    scripts_path / "scrape_hmart.py"
-                )
-                hmart_module = importlib.util.module_from_spec(hmart_spec)
-                hmart_spec.loader.exec_module(hmart_module)
-                scraper_class = hmart_module.HmartScraper
-            elif store_lower in ['stew leonards', 'stew leonard\'s', 'stew leonard', 'stew-leonards', 'stew-leonard\'s', 'stew-leonard']:
-                # Import Stew Leonard's scraper
-                stew_spec = importlib.util.spec_from_file_location(
-                    "scrape_stew_leonards",
-                    scripts_path / "scrape_stew_leonards.py"
-                )
-                stew_module = importlib.util.module_from_spec(stew_spec)
-                stew_spec.loader.exec_module(stew_module)
-                scraper_class = stew_module.StewLeonardsScraper
-                
-                # If URL is provided, create scraper with URL and run directly
-                if url:
-                    scraper = scraper_class(url=url)
-                    await scraper.initialize()
+            # If URL is provided for Stew Leonard's, create scraper with URL and run directly
+            if url and scraper_class is scraper_module.StewLeonardsScraper:
+                scraper = scraper_class(url=url)
+                try:
                     deals = await scraper.scrape_weekly_specials(url=url)
-                    saved_paths = await scraper.save_deals_to_json(deals)
-                    click.echo(f"✅ Scraping complete! Saved {len(saved_paths)} deals.")
-                    return
+                    if ndjson:
+                        path = await scraper.save_deals_to_ndjson(deals)
+                        click.echo(f"✅ Scraping complete! Saved {len(deals)} deals to {path}.")
+                    else:
+                        saved_paths = await scraper.save_deals_to_json(deals)
+                        click.echo(f"✅ Scraping complete! Saved {len(saved_paths)} deals.")
+                finally:
+                    await scraper.close()
+                return
             
-            await scraper_module.scrape_store(store, scraper_class)
+            await scraper_module.scrape_store(store, scraper_class, ndjson=ndjson)
         else:
             click.echo("❌ Please specify --store or --all")
             exit(1)
@@ -324,11 +299,13 @@ async def _scrape(store: Optional[str], url: Optional[str], all: bool):
 @main.command('init-stores')
 def init_stores():
     """Initialize stores in the database."""
-    asyncio.run(_init_stores())
+    run(_init_stores())
 
 
 async def _init_stores():
     """Initialize stores."""
+    from ..database import close_pool
+    from ..services.store_service import StoreService
     try:
         click.echo("🏪 Initializing stores...")
         
@@ -370,11 +347,13 @@ async def _init_stores():
 @click.option('--website', type=str, help='New website URL')
 def update_store(id: Optional[int], name: Optional[str], new_name: Optional[str], location: Optional[str], website: Optional[str]):
     """Update store information."""
-    asyncio.run(_update_store(id, name, new_name, location, website))
+    run(_update_store(id, name, new_name, location, website))
 
 
 async def _update_store(store_id: Optional[int], store_name: Optional[str], new_name: Optional[str], location: Optional[str], website: Optional[str]):
     """Update store information."""
+    from ..database import close_pool
+    from ..services.store_service import StoreService
     try:
         # Find the store
         store = None
@@ -384,21 +363,7 @@ async def _update_store(store_id: Optional[int], store_name: Optional[str], new_
                 click.echo(f"❌ Store with ID {store_id} not found")
                 exit(1)
         elif store_name:
-            # Find by name
-            pool = await get_pool()
-            async with pool.acquire() as conn:
-                query = "SELECT * FROM stores WHERE name = $1"
-                row = await conn.fetchrow(query, store_name)
-                if row:
-                    from ..models.grocery import Store
-                    store = Store(
-                        id=row['id'],
-                        name=row['name'],
-                        location=row['location'],
-                        website=row['website'],
-                        created_at=row['created_at'],
-                        updated_at=row['updated_at']
-                    )
+            store = await StoreService.get_by_name(store_name)
             if not store:
                 click.echo(f"❌ Store '{store_name}' not found")
                 exit(1)
@@ -16,6 +16,8 @@ class DatabaseConfig:
         self.database = os.getenv('DB_NAME', 'groceries')
         self.password = os.getenv('DB_PASSWORD', 'postgres')
         self.port = int(os.getenv('DB_PORT', '5432'))
+        self.pool_min_size = int(os.getenv('DB_POOL_MIN_SIZE', '5'))
+        self.pool_max_size = int(os.getenv('DB_POOL_MAX_SIZE', '30'))
 
 
 class AppConfig:
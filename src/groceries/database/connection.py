@@ -9,18 +9,31 @@ from ..config import db_config
 _pool: Optional[Pool] = None
 
 
-async def get_pool() -> Pool:
-    """Get the database connection pool."""
+async def get_pool(min_size: Optional[int] = None, max_size: Optional[int] = None) -> Pool:
+    """
+    Get the database connection pool.
+    
+    The pool is created on first use, so sizes only apply to that first call.
+    Short-lived scripts should call this early with a small pool. asyncpg
+    hands out the most recently released connection first, which keeps a
+    few connections (and their statement caches) hot.
+    
+    Args:
+        min_size: Minimum number of connections (defaults to DB_POOL_MIN_SIZE)
+        max_size: Maximum number of connections (defaults to DB_POOL_MAX_SIZE)
+    """
     global _pool
     if _pool is None:
+        max_size = max_size or db_config.pool_max_size
+        min_size = min(min_size if min_size is not None else db_config.pool_min_size, max_size)
         _pool = await asyncpg.create_pool(
             user=db_config.user,
             host=db_config.host,
             database=db_config.database,
             password=db_config.password,
             port=db_config.port,
-            min_size=5,
-            max_size=30,
+            min_size=min_size,
+            max_size=max_size,
             command_timeout=60,
             max_inactive_connection_lifetime=300
         )
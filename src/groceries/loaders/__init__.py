@@ -0,0 +1,5 @@
+"""Loaders that move staged deal files into the database."""
+
+from .json_loader import load_directory, load_files_bulk
+
+__all__ = ['load_directory', 'load_files_bulk']
@@ -0,0 +1,591 @@
+"""
+Load all JSON files from data/stage into the database.
+
+Usage:
+    python scripts/processing/load_json_to_db.py
+    python scripts/processing/load_json_to_db.py --directory data/stage/hmart
+    python scripts/processing/load_json_to_db.py --directory data/stage/hmart --dry-run
+    python scripts/processing/load_json_to_db.py --directory data/stage/hmart --per-file
+
+Both per-deal .json files and .ndjson batch files (one deal per line) are loaded.
+"""
+
+import asyncio
+import functools
+import itertools
+import os
+from pathlib import Path
+from datetime import date
+from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
+import argparse
+
+import orjson
+from pydantic import TypeAdapter
+
+from ..models.grocery import GroceryDeal
+from ..services.grocery_service import GroceryService
+from ..config import db_config
+from ..database import get_pool, close_pool
+from ..utils.load_ledger import LoadLedger
+from ..utils.event_loop import run
+
+
+# Maximum number of JSON files parsed concurrently in bulk mode
+PARSE_CONCURRENCY = 32
+
+# Number of concurrent inserters draining the parse queue in per-file mode
+INSERT_WORKERS = 4
+
+DATE_KEYS = ('valid_from', 'valid_to')
+PRICE_KEYS = ('regular_price', 'sale_price', 'quantity', 'discount_percentage')
+
+JSON_SUFFIXES = ('.json', '.ndjson')
+
+# Built once so every file validates against the same compiled schema
+_DEAL_ADAPTER = TypeAdapter(GroceryDeal)
+
+
+@functools.lru_cache(maxsize=4096)
+def _d_from_str(value: str) -> Decimal:
+    return Decimal(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _d_from_float(value: float) -> Decimal:
+    # Go through str() so 1.1 stays Decimal('1.1') rather than its binary expansion
+    return Decimal(str(value))
+
+
+@functools.lru_cache(maxsize=1024)
+def _date_from_str(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _load_json(json_file_path: str) -> dict:
+    """Read a JSON file and parse it with orjson."""
+    try:
+        return orjson.loads(Path(json_file_path).read_bytes())
+    except Exception as e:
+        raise Exception(f"Error loading JSON file: {str(e)}")
+
+
+def _deal_from_data(deal_data: dict) -> GroceryDeal:
+    """Coerce dates/prices in a decoded deal dict and validate it."""
+    # Convert date strings to date objects
+    for date_field in DATE_KEYS:
+        value = deal_data.get(date_field)
+        if type(value) is str:
+            deal_data[date_field] = _date_from_str(value)
+    
+    # Convert Decimal strings/floats to Decimal
+    for price_field in PRICE_KEYS:
+        value = deal_data.get(price_field)
+        if value is None or type(value) is Decimal:
+            continue
+        if type(value) is str:
+            deal_data[price_field] = _d_from_str(value)
+        elif type(value) is float:
+            deal_data[price_field] = _d_from_float(value)
+    
+    return _DEAL_ADAPTER.validate_python(deal_data)
+
+
+def _parse_deal(json_file_path: str) -> GroceryDeal:
+    """Read, decode and validate a single deal JSON file."""
+    return _deal_from_data(_load_json(json_file_path))
+
+
+def _parse_deals(file_path: str) -> List[GroceryDeal]:
+    """Read, decode and validate every deal in a .json or .ndjson file."""
+    if not file_path.endswith('.ndjson'):
+        return [_parse_deal(file_path)]
+    
+    content = Path(file_path).read_bytes()
+    deals = []
+    for line_number, line in enumerate(content.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            deals.append(_deal_from_data(orjson.loads(line)))
+        except Exception as e:
+            raise Exception(f"Line {line_number}: {str(e)}")
+    return deals
+
+
+async def parse_deal_from_json(json_file_path: str) -> GroceryDeal:
+    """
+    Read a single deal JSON file and validate it into a GroceryDeal.
+    
+    The read, parse and validation all run in one worker thread.
+    
+    Raises:
+        Exception: If the file cannot be read or fails validation
+    """
+    return await asyncio.to_thread(_parse_deal, json_file_path)
+
+
+async def parse_deals_from_file(file_path: str) -> List[GroceryDeal]:
+    """
+    Read a .json file (one deal) or .ndjson file (one deal per line).
+    
+    The read, parse and validation all run in one worker thread, so the
+    event loop is only touched once per file.
+    
+    Raises:
+        Exception: If the file cannot be read or any deal fails validation
+    """
+    return await asyncio.to_thread(_parse_deals, file_path)
+
+
+def _result(
+    success: bool,
+    product_name: str,
+    already_exists: bool = False,
+    error: Optional[str] = None,
+    deal_id: Optional[int] = None,
+    uuid: Optional[str] = None
+) -> dict:
+    """Build a load result dict."""
+    return {
+        'success': success,
+        'already_exists': already_exists,
+        'error': error,
+        'deal_id': deal_id,
+        'uuid': uuid,
+        'product_name': product_name
+    }
+
+
+async def insert_deal(deal: GroceryDeal, dry_run: bool = False) -> dict:
+    """
+    Insert a single validated deal into the database.
+    
+    Returns:
+        dict with keys: success, already_exists, error, deal_id, uuid
+    """
+    try:
+        if dry_run:
+            return _result(True, deal.product_name, uuid=deal.uuid)
+        
+        created_deal = await GroceryService.create(deal)
+        
+        if created_deal:
+            return _result(
+                True, created_deal.product_name,
+                deal_id=created_deal.id, uuid=created_deal.uuid
+            )
+        
+        # Check if it's a duplicate by trying to fetch by UUID
+        if deal.uuid:
+            existing = await GroceryService.get_by_uuid(deal.uuid)
+            if existing:
+                return _result(
+                    True, deal.product_name, already_exists=True,
+                    deal_id=existing.id, uuid=deal.uuid
+                )
+        
+        return _result(
+            False, deal.product_name,
+            error='Failed to create deal (unknown reason)', uuid=deal.uuid
+        )
+    
+    except Exception as e:
+        return _result(False, deal.product_name, error=str(e), uuid=deal.uuid)
+
+
+async def load_deal_from_json(json_file_path: str, dry_run: bool = False) -> dict:
+    """
+    Load a single deal JSON file into the database.
+    
+    Returns:
+        dict with keys: success, already_exists, error, deal_id, uuid
+    """
+    try:
+        deal = await parse_deal_from_json(json_file_path)
+    except Exception as e:
+        return _result(False, Path(json_file_path).name, error=str(e))
+    
+    return await insert_deal(deal, dry_run=dry_run)
+
+
+def iter_json_files(directory: str) -> Iterator[str]:
+    """
+    Yield JSON and NDJSON files under a directory.
+    
+    Walks the tree with os.scandir in a single pass per directory. Hidden
+    entries (like the .loaded.sqlite ledger) are skipped and no ordering
+    is guaranteed.
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(JSON_SUFFIXES):
+                    yield entry.path
+
+
+def find_json_files(directory: str) -> List[str]:
+    """Find JSON and NDJSON files under a directory, sorted so runs see a stable order."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(iter_json_files(directory))
+
+
+def print_summary(
+    successful: int,
+    already_exists: int,
+    failed: int,
+    total: int,
+    errors: Optional[List[str]] = None
+):
+    """Print collected errors followed by the load summary."""
+    if errors:
+        print()
+        print("❌ Errors:")
+        print("\n".join(errors))
+    
+    print()
+    print("=" * 60)
+    print("📊 Summary:")
+    print(f"  ✅ Successfully loaded: {successful}")
+    print(f"  ℹ️  Already exists: {already_exists}")
+    print(f"  ❌ Failed: {failed}")
+    print(f"  📁 Total files: {total}")
+    print("=" * 60)
+
+
+def _files_to_load(
+    directory: str,
+    dry_run: bool,
+    ledger: Optional[LoadLedger] = None,
+    limit: Optional[int] = None
+) -> List[str]:
+    """Find the files to load, dropping ones the ledger says are already loaded.
+    
+    The limit applies after the ledger check, so repeated limited runs work
+    through the directory instead of picking the same files every time.
+    """
+    all_files = find_json_files(directory)
+    
+    if not all_files:
+        print(f"❌ No JSON files found in {directory}")
+        return []
+    
+    print(f"📊 Found {len(all_files)} JSON files")
+    
+    candidates = ledger.iter_new(all_files) if ledger else iter(all_files)
+    json_files = list(itertools.islice(candidates, limit))
+    
+    if ledger:
+        if not json_files:
+            print("✅ Nothing new to load (use --force to reload)")
+            return []
+        if limit is None and len(json_files) < len(all_files):
+            skipped = len(all_files) - len(json_files)
+            print(f"⏭️  Skipping {skipped} files already loaded (use --force to reload)")
+    
+    print(f"📊 Loading {len(json_files)} JSON files")
+    
+    if dry_run:
+        print("🔍 DRY RUN MODE - No changes will be made to the database")
+    print()
+    
+    return json_files
+
+
+async def load_directory(
+    directory: str,
+    dry_run: bool = False,
+    verbose: bool = False,
+    per_file: bool = False,
+    force: bool = False,
+    limit: Optional[int] = None
+):
+    """
+    Load all JSON files from a directory into the database.
+    
+    Files recorded in the load ledger (data/stage/.loaded.sqlite) for the
+    configured database with an unchanged mtime are skipped unless force is set.
+    
+    Args:
+        directory: Directory path to search for JSON files
+        dry_run: If True, only validate files without loading to DB
+        verbose: If True, print details for each file
+        per_file: If True, insert one deal per transaction (useful for debugging).
+            Files are parsed concurrently and handed to a few inserter
+            coroutines through a queue.
+        force: If True, load files even if the ledger says they were loaded
+        limit: Optional maximum number of files to consider
+    """
+    ledger = None if dry_run else LoadLedger(database=db_config.database)
+    
+    try:
+        json_files = _files_to_load(directory, dry_run, None if force else ledger, limit)
+        if not json_files:
+            return
+        
+        if not dry_run:
+            # Size the pool for the inserters instead of the 30-connection default
+            await get_pool(min_size=2, max_size=INSERT_WORKERS)
+        
+        if per_file:
+            loaded_files = await _load_files_per_file(json_files, dry_run, verbose)
+        else:
+            loaded_files = await load_files_bulk(json_files, dry_run, verbose)
+        
+        if ledger and loaded_files:
+            ledger.mark_loaded(loaded_files)
+    finally:
+        if ledger:
+            ledger.close()
+
+
+async def _load_files_per_file(json_files: List[str], dry_run: bool, verbose: bool) -> List[str]:
+    """
+    Load files one deal per transaction through a parse queue.
+    
+    Returns:
+        Files whose deals were all loaded or already existed
+    """
+    failed_files = set()
+    semaphore = asyncio.Semaphore(PARSE_CONCURRENCY)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PARSE_CONCURRENCY * 2)
+    counts = {'successful': 0, 'already_exists': 0, 'failed': 0, 'processed': 0}
+    errors: List[str] = []
+    # Roughly 100 progress lines per run, and at most one every 10 deals
+    progress_every = max(len(json_files) // 100, 10)
+    
+    async def parse(json_file: str) -> Tuple[str, Optional[List[GroceryDeal]], Optional[str]]:
+        async with semaphore:
+            try:
+                return json_file, await parse_deals_from_file(json_file), None
+            except Exception as e:
+                return json_file, None, str(e)
+    
+    def record(json_file: str, result: dict):
+        counts['processed'] += 1
+        idx = counts['processed']
+        if verbose or idx % progress_every == 0:
+            print(f"[{idx}/{len(json_files)}] Processed: {Path(json_file).name}")
+        
+        if result['success']:
+            if result['already_exists']:
+                counts['already_exists'] += 1
+                if verbose:
+                    print(f"  ℹ️  Already exists: {result['product_name'][:50]}")
+            else:
+                counts['successful'] += 1
+                if verbose:
+                    print(f"  ✅ Loaded: {result['product_name'][:50]} (ID: {result['deal_id']})")
+        else:
+            counts['failed'] += 1
+            failed_files.add(json_file)
+            errors.append(f"  {result['product_name'][:50]}: {result['error']}")
+    
+    async def inserter():
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                json_file, deal = item
+                record(json_file, await insert_deal(deal, dry_run=dry_run))
+            finally:
+                queue.task_done()
+    
+    workers = [asyncio.create_task(inserter()) for _ in range(INSERT_WORKERS)]
+    parse_tasks = [asyncio.create_task(parse(json_file)) for json_file in json_files]
+    
+    try:
+        # Feed deals to the inserters as soon as each file is parsed
+        for next_parsed in asyncio.as_completed(parse_tasks):
+            json_file, deals, error = await next_parsed
+            if deals is None:
+                record(json_file, _result(False, Path(json_file).name, error=error))
+                continue
+            for deal in deals:
+                await queue.put((json_file, deal))
+        
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in parse_tasks + workers:
+            task.cancel()
+    
+    print_summary(
+        counts['successful'], counts['already_exists'], counts['failed'], len(json_files),
+        errors
+    )
+    
+    return [json_file for json_file in json_files if json_file not in failed_files]
+
+
+async def load_directory_bulk(
+    directory: str,
+    dry_run: bool = False,
+    verbose: bool = False,
+    concurrency: int = PARSE_CONCURRENCY
+):
+    """
+    Load all JSON files from a directory in a single bulk insert.
+    
+    Unlike load_directory, this does not consult the load ledger.
+    
+    Args:
+        directory: Directory path to search for JSON files
+        dry_run: If True, only validate files without loading to DB
+        verbose: If True, print details for each file
+        concurrency: Maximum number of files parsed at once
+    """
+    json_files = _files_to_load(directory, dry_run)
+    if json_files:
+        await load_files_bulk(json_files, dry_run, verbose, concurrency)
+
+
+async def load_files_bulk(
+    json_files: List[str],
+    dry_run: bool = False,
+    verbose: bool = False,
+    concurrency: int = PARSE_CONCURRENCY
+) -> List[str]:
+    """
+    Load the given files in a single bulk insert.
+    
+    Files are parsed and validated concurrently, then every valid deal is
+    inserted with GroceryService.bulk_create.
+    
+    Returns:
+        Files whose deals were all loaded or already existed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def parse(json_file: str) -> List[GroceryDeal]:
+        async with semaphore:
+            return await parse_deals_from_file(json_file)
+    
+    results = await asyncio.gather(
+        *(parse(json_file) for json_file in json_files),
+        return_exceptions=True
+    )
+    
+    parsed = []
+    errors = []
+    failed = 0
+    for json_file, result in zip(json_files, results, strict=True):
+        if isinstance(result, Exception):
+            failed += 1
+            errors.append(f"  {Path(json_file).name[:50]}: {result}")
+        else:
+            parsed.append((json_file, result))
+    
+    deals = [deal for _, file_deals in parsed for deal in file_deals]
+    parsed_files = [json_file for json_file, _ in parsed]
+    print(f"✅ Parsed {len(deals)} deals ({failed} failed)")
+    
+    if dry_run or not deals:
+        print_summary(len(deals), 0, failed, len(json_files), errors)
+        return parsed_files
+    
+    try:
+        inserted, insert_errors = await GroceryService.bulk_create(deals)
+    except Exception as e:
+        print(f"❌ Bulk insert failed: {e}")
+        print_summary(0, 0, failed + len(deals), len(json_files), errors)
+        return []
+    
+    inserted = set(inserted)
+    for error in {id(error): error for error in insert_errors.values()}.values():
+        errors.append(f"  Bulk insert shard failed: {error}")
+    
+    successful = 0
+    already_exists = 0
+    for deal in deals:
+        if deal.uuid in insert_errors:
+            failed += 1
+            if verbose:
+                print(f"  ❌ Failed: {deal.product_name[:50]}")
+        elif deal.uuid in inserted:
+            successful += 1
+            if verbose:
+                print(f"  ✅ Loaded: {deal.product_name[:50]}")
+        else:
+            already_exists += 1
+            if verbose:
+                print(f"  ℹ️  Already exists: {deal.product_name[:50]}")
+    
+    print_summary(successful, already_exists, failed, len(json_files), errors)
+    
+    # Files with a deal in a failed shard stay off the ledger so they are retried
+    return [
+        json_file for json_file, file_deals in parsed
+        if not any(deal.uuid in insert_errors for deal in file_deals)
+    ]
+
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Load JSON files into the database')
+    parser.add_argument(
+        '--directory',
+        type=str,
+        default='data/stage',
+        help='Directory to load JSON files from (default: data/stage)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Validate files without loading to database'
+    )
+    parser.add_argument(
+        '--verbose',
+        '-v',
+        action='store_true',
+        help='Show detailed output for each file'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reload files even if the load ledger says they were already loaded'
+    )
+    parser.add_argument(
+        '--limit',
+        type=int,
+        help='Only consider the first N files found'
+    )
+    parser.add_argument(
+        '--per-file',
+        action='store_true',
+        help='Insert one deal at a time instead of a single bulk insert (for debugging)'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        await load_directory(
+            args.directory,
+            dry_run=args.dry_run,
+            verbose=args.verbose,
+            per_file=args.per_file,
+            force=args.force,
+            limit=args.limit
+        )
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted by user")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        await close_pool()
+
+
+if __name__ == '__main__':
+    run(main())
+
@@ -0,0 +1,5 @@
+"""Store scrapers for grocery deals."""
+
+from .base_scraper import BaseGroceryScraper
+
+__all__ = ['BaseGroceryScraper']
@@ -0,0 +1,205 @@
+"""Base scraper class for grocery deals."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from datetime import date, datetime
+
+from ..models.grocery import GroceryDeal, Store
+from ..services.grocery_service import GroceryService
+from ..services.store_service import StoreService
+from ..utils.json_processor import JSONProcessor
+from ..utils.deal_writer import DealWriter
+
+
+class BaseGroceryScraper(ABC):
+    """Base class for grocery store scrapers."""
+    
+    def __init__(self, store_name: str, output_dir: Optional[str] = None):
+        """
+        Initialize the scraper.
+        
+        Args:
+            store_name: Name of the store to scrape
+            output_dir: Optional subdirectory within data/stage/ for output
+        """
+        self.store_name = store_name
+        self.output_dir = output_dir
+        self.json_processor = JSONProcessor()
+        self.store: Optional[Store] = None
+    
+    async def initialize(self, refresh: bool = False):
+        """
+        Initialize the scraper (get or create store record).
+        
+        Store records are cached per process by StoreService, so scrapers for
+        the same store only hit the database once.
+        
+        Args:
+            refresh: If True, bypass the cache and look the store up again
+        """
+        if refresh:
+            StoreService._cache.pop(self.store_name, None)
+        
+        # Get website URL if available
+        website = getattr(self, 'website_url', None)
+        
+        self.store = await StoreService.get_or_create_store(
+            name=self.store_name,
+            location=None,
+            website=website
+        )
+        
+        if not self.store or not self.store.id:
+            raise ValueError(f"Failed to get or create store: {self.store_name}")
+        
+        print(f"✅ Initialized scraper for {self.store_name} (Store ID: {self.store.id})")
+    
+    async def ensure_store(self) -> Store:
+        """
+        Return the store record, resolving it on first use.
+        
+        Scrapers call this inside their error handling once a fetched page
+        has product items to stamp with the store ID, so runs whose pages
+        come back empty or fail to load never touch the database.
+        """
+        if self.store is None:
+            await self.initialize()
+        return self.store
+    
+    @abstractmethod
+    async def scrape_deals(self) -> List[GroceryDeal]:
+        """
+        Scrape deals from the store.
+        
+        This method should be implemented by each store-specific scraper.
+        
+        Returns:
+            List of GroceryDeal objects
+        """
+        pass
+    
+    async def save_deals_to_json(self, deals: List[GroceryDeal]) -> List[str]:
+        """
+        Save deals to JSON files.
+        
+        Files are written by a background DealWriter in batches.
+        
+        Args:
+            deals: List of GroceryDeal objects to save
+        
+        Returns:
+            List of file paths where deals were saved
+        """
+        writer = DealWriter(self.output_dir)
+        
+        for deal in deals:
+            # Ensure store_id is set
+            if not deal.store_id and self.store:
+                deal.store_id = self.store.id
+            
+            await writer.put(deal)
+        
+        return await writer.close()
+    
+    async def save_deals_to_ndjson(self, deals: List[GroceryDeal]) -> str:
+        """
+        Save all deals to a single NDJSON file.
+        
+        Args:
+            deals: List of GroceryDeal objects to save
+        
+        Returns:
+            Path of the NDJSON file
+        """
+        for deal in deals:
+            # Ensure store_id is set
+            if not deal.store_id and self.store:
+                deal.store_id = self.store.id
+        
+        return await self.json_processor.save_deals_ndjson(deals, self.output_dir)
+    
+    async def close(self):
+        """Release resources held by the scraper (HTTP clients, browsers)."""
+        pass
+    
+    async def _scrape(self) -> List[GroceryDeal]:
+        """Scrape deals and stamp them with the store ID."""
+        print(f"\n🔍 Scraping deals from {self.store_name}...")
+        deals = await self.scrape_deals()
+        
+        if not deals:
+            print(f"⚠️  No deals found for {self.store_name}")
+            return []
+        
+        print(f"✅ Found {len(deals)} deals from {self.store_name}")
+        
+        store = await self.ensure_store()
+        for deal in deals:
+            # Ensure store_id is set
+            if not deal.store_id:
+                deal.store_id = store.id
+        
+        return deals
+    
+    async def run(self, ndjson: bool = False) -> List[str]:
+        """
+        Run the scraper: scrape deals and save to JSON.
+        
+        Args:
+            ndjson: If True, write one NDJSON file for the whole run instead
+                of one JSON file per deal
+        
+        Returns:
+            List of file paths where deals were saved
+        """
+        try:
+            deals = await self._scrape()
+            if not deals:
+                return []
+            
+            if ndjson:
+                path = await self.save_deals_to_ndjson(deals)
+                print(f"💾 Saved {len(deals)} deals to {path}")
+                return [path]
+            
+            saved_paths = await self.save_deals_to_json(deals)
+            print(f"💾 Saved {len(saved_paths)} deals to JSON files")
+            
+            return saved_paths
+        finally:
+            await self.close()
+    
+    async def run_and_load(self, archive: bool = True) -> List[str]:
+        """
+        Scrape deals and insert them straight into the database.
+        
+        Skips the JSON write/read round-trip of run() followed by
+        load-directory. Deals are bulk inserted with GroceryService.bulk_create.
+        
+        Args:
+            archive: If True, also save the run as an NDJSON file while inserting
+        
+        Returns:
+            UUIDs of the deals that were newly inserted
+        """
+        try:
+            deals = await self._scrape()
+            if not deals:
+                return []
+            
+            archive_task = asyncio.create_task(self.save_deals_to_ndjson(deals)) if archive else None
+            try:
+                inserted, failed = await GroceryService.bulk_create(deals)
+            finally:
+                # The archive is the only copy of the scrape if the insert fails
+                if archive_task:
+                    print(f"💾 Archived {len(deals)} deals to {await archive_task}")
+            
+            print(f"💾 Inserted {len(inserted)} new deals ({len(deals) - len(inserted) - len(failed)} already existed)")
+            if failed:
+                print(f"❌ Failed to insert {len(failed)} deals: {next(iter(failed.values()))}")
+            
+            return inserted
+        finally:
+            await self.close()
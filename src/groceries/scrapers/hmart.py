@@ -0,0 +1,574 @@
+"""
+Hmart scraper for www.hmart.com
+
+Scrapes weekly deals, flash sales, and product listings from Hmart website.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+import httpx
+from ..models.grocery import GroceryDeal, Category
+from ..services.category_service import CategoryService
+from ..utils import run
+from .base_scraper import BaseGroceryScraper
+
+
+# Per-item parse failures are routine on scraped markup; surface them only at DEBUG level
+logger = logging.getLogger(__name__)
+
+# Number within cleaned price text
+_PRICE_RE = re.compile(r'(\d+\.?\d*)')
+
+# Dollar amounts in raw item markup, scanned without building the item's text
+_FALLBACK_PRICE_RE = re.compile(rb'\$\s*(\d+\.\d{2})')
+
+
+def _contains_selector(tags: List[str], attr: str, words: List[str]) -> str:
+    """Build a CSS selector matching any tag whose attribute contains any word (case-insensitive)."""
+    return ', '.join(f'{tag}[{attr}*="{word}" i]' for tag in tags for word in words)
+
+
+# CSS selectors for product markup; select() matches them in a single subtree walk
+_SEL_PRODUCT = _contains_selector(['div', 'article', 'li'], 'class', ['product', 'deal', 'item'])
+_SEL_FLASH_PRODUCT = _contains_selector(['div', 'article', 'li'], 'class', ['product', 'deal', 'item', 'flash'])
+_SEL_TITLE = _contains_selector(['h2', 'h3', 'h4', 'a', 'span'], 'class', ['title', 'name', 'product'])
+_SEL_FLASH_TITLE = _contains_selector(['h2', 'h3', 'h4', 'a'], 'class', ['title', 'name'])
+_SEL_PRODUCT_LINK = _contains_selector(['a'], 'href', ['/product', '/item'])
+_SEL_PRICE = _contains_selector(['span', 'div', 'p', 'strong'], 'class', ['price', 'cost', 'amount'])
+_SEL_MAIN_PRICE = _contains_selector(['span', 'div', 'p'], 'class', ['price', 'cost'])
+_SEL_STRIKE_STYLE = ', '.join(
+    f'{tag}[style*="line-through" i], {tag}[style*="text-decoration" i][style*="line" i]'
+    for tag in ['span', 'div', 'del', 's']
+)
+_SEL_STRIKE = _contains_selector(['span', 'div'], 'class', ['strike', 'original', 'was', 'regular', 'list'])
+_SEL_DESC = _contains_selector(['p', 'div', 'span'], 'class', ['desc'])
+_SEL_CATEGORY = _contains_selector(['a', 'span'], 'class', ['category', 'tag'])
+_SEL_IMG = 'img'
+_SEL_LINK = 'a[href]'
+
+# Quantity followed by a common unit (lb, lbs, oz, oz., g, kg, each, pack, ct, count, pcs)
+_UNIT_RE = re.compile(r'(\d+\.?\d*)\s*(lbs?|oz\.?|kg|g|each|pack|ct|count|pcs)\b')
+
+# Class/context substrings that mark a price as regular or sale
+_REGULAR_INDICATORS = ('regular', 'original', 'was', 'list', 'before', 'compare', 'strike', 'del')
+_SALE_INDICATORS = ('sale', 'discount', 'now', 'special', 'deal', 'price')
+
+# Strips currency symbols and thousands separators from price text
+_PRICE_TRANS = str.maketrans('', '', '$,')
+
+# Decimal constants for discount arithmetic
+_HUNDRED = Decimal(100)
+_CENT = Decimal('0.01')
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price_text: str) -> Optional[Decimal]:
+    """Parse a non-empty price string; cached because the same prices repeat across a page."""
+    # Remove currency symbols and whitespace
+    price_text = price_text.translate(_PRICE_TRANS).strip()
+    
+    # Fast path for plain numbers like '5.99'
+    if price_text.replace('.', '', 1).isdecimal():
+        return Decimal(price_text)
+    
+    # Extract number
+    match = _PRICE_RE.search(price_text)
+    if match:
+        try:
+            return Decimal(match.group(1))
+        except InvalidOperation:
+            return None
+    return None
+
+
+@lru_cache(maxsize=1)
+def _week_bounds(today_ordinal: int) -> Tuple[date, date]:
+    """Return the Sunday-Saturday week containing the given day (keyed by ordinal so it rolls over at midnight)."""
+    today = date.fromordinal(today_ordinal)
+    # Find previous Sunday
+    valid_from = today - timedelta(days=today.weekday() + 1)
+    return valid_from, valid_from + timedelta(days=6)
+
+
+@lru_cache(maxsize=1)
+def _flash_sale_window(today_ordinal: int) -> Tuple[date, date]:
+    """Return the validity window for a flash sale starting on the given day."""
+    today = date.fromordinal(today_ordinal)
+    return today, today + timedelta(days=1)  # Assume 24-hour flash sale
+
+
+class HmartScraper(BaseGroceryScraper):
+    """
+    Hmart scraper implementation.
+    
+    Scrapes deals from www.hmart.com including:
+    - Weekly ads/specials
+    - Flash sales
+    - Best sellers
+    - Category pages
+    """
+    
+    BASE_URL = "https://www.hmart.com"
+    WEEKLY_ADS_URL = f"{BASE_URL}/weekly-ads"
+    FLASH_SALE_URL = f"{BASE_URL}/flash-sale"
+    BEST_SELLER_URL = f"{BASE_URL}/best-seller"
+    
+    def __init__(self, store_name: str = "Hmart", output_dir: Optional[str] = None):
+        """Initialize Hmart scraper."""
+        super().__init__(store_name, output_dir or "hmart")
+        self.website_url = self.BASE_URL
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            },
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0)
+        )
+        self.categories_cache = {}
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def get_or_create_category(self, category_name: str) -> Optional[int]:
+        """
+        Get or create a category and return its ID.
+        
+        The cache holds one lookup task per name, so concurrent items with the
+        same category share a single database round-trip.
+        """
+        task = self.categories_cache.get(category_name)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup_category_id(category_name))
+            self.categories_cache[category_name] = task
+        
+        category_id = None
+        try:
+            category_id = await asyncio.shield(task)
+        finally:
+            # Don't cache failures so the next item retries
+            if category_id is None and task.done() and self.categories_cache.get(category_name) is task:
+                del self.categories_cache[category_name]
+        return category_id
+    
+    @staticmethod
+    async def _lookup_category_id(category_name: str) -> Optional[int]:
+        """Fetch or create a category and return its ID."""
+        category = await CategoryService.get_or_create_category(category_name)
+        if category and category.id:
+            return category.id
+        return None
+    
+    @staticmethod
+    def parse_price(price_text: str) -> Optional[Decimal]:
+        """Parse price from text like '$5.99' or '5.99'."""
+        if not price_text:
+            return None
+        return _parse_price(price_text)
+    
+    @staticmethod
+    def extract_unit_and_quantity(product_name: str, description: str = "") -> Tuple[Optional[str], Optional[Decimal]]:
+        """Extract unit and quantity from product name or description."""
+        unit = None
+        quantity = None
+        
+        # Look for unit patterns
+        text = f"{product_name} {description}".lower()
+        
+        match = _UNIT_RE.search(text)
+        if match:
+            try:
+                quantity = Decimal(match.group(1))
+                unit = match.group(2).rstrip('.')
+            except InvalidOperation:
+                quantity = None
+        
+        return unit, quantity
+    
+    def calculate_discount(self, regular_price: Optional[Decimal], sale_price: Optional[Decimal]) -> Optional[Decimal]:
+        """Calculate discount percentage.
+        
+        Returns positive percentage if sale_price < regular_price (actual discount).
+        Returns None if prices are invalid or sale_price >= regular_price.
+        """
+        if not regular_price or not sale_price or regular_price <= 0:
+            return None
+        
+        # If sale price is higher than regular price, something is wrong - don't calculate discount
+        if sale_price >= regular_price:
+            return None
+        
+        # Calculate discount: ((regular - sale) / regular) * 100
+        discount = (regular_price - sale_price) * _HUNDRED / regular_price
+        return discount.quantize(_CENT)
+    
+    def _extract_prices(self, item) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """
+        Extract regular and sale prices from a product item.
+        
+        Args:
+            item: Product item element
+        
+        Returns:
+            Tuple of (regular_price, sale_price)
+        """
+        sale_price = None
+        regular_price = None
+        ambiguous_prices = []
+        
+        # Find all price-related elements
+        price_elems = item.select(_SEL_PRICE)
+        
+        # Also look for strikethrough text (often indicates regular price)
+        strikethrough_elems = item.select(_SEL_STRIKE_STYLE)
+        strikethrough_elems.extend(item.select(_SEL_STRIKE))
+        
+        # Extract regular price from strikethrough or "was/original" elements
+        for se in strikethrough_elems:
+            price_text_se = se.get_text(strip=True)
+            price_val = self.parse_price(price_text_se)
+            if price_val and not regular_price:
+                regular_price = price_val
+        
+        # Look through all price elements
+        for pe in price_elems:
+            price_text_pe = pe.get_text(strip=True)
+            price_val = self.parse_price(price_text_pe)
+        
+            if not price_val:
+                continue
+        
+            # Check class names first; only walk the parent's text if they are inconclusive
+            classes = ' '.join(pe.get('class', ())).lower()
+            is_regular = any(indicator in classes for indicator in _REGULAR_INDICATORS)
+            is_sale = any(indicator in classes for indicator in _SALE_INDICATORS)
+            if not (is_regular and is_sale) and pe.parent:
+                parent_text = pe.parent.get_text(strip=True).lower()
+                is_regular = is_regular or any(indicator in parent_text for indicator in _REGULAR_INDICATORS)
+                is_sale = is_sale or any(indicator in parent_text for indicator in _SALE_INDICATORS)
+            
+            if is_regular and not regular_price:
+                regular_price = price_val
+            elif is_sale and not sale_price:
+                sale_price = price_val
+            elif not is_regular and not is_sale:
+                ambiguous_prices.append(price_val)
+        
+        # Fill remaining slots from ambiguous prices: lower is sale, higher is regular
+        if ambiguous_prices:
+            if not sale_price and not regular_price:
+                sale_price = min(ambiguous_prices)
+                if len(ambiguous_prices) > 1:
+                    regular_price = max(ambiguous_prices)
+            elif not sale_price:
+                sale_price = min(ambiguous_prices)
+            elif not regular_price:
+                regular_price = max(ambiguous_prices)
+        
+        # If we found a regular price but no sale price, check if there's a lower price
+        if regular_price and not sale_price:
+            # Look for any other dollar amount that might be the sale price
+            for match in _FALLBACK_PRICE_RE.finditer(item.encode()):
+                price_val = Decimal(match.group(1).decode('ascii'))
+                if price_val < regular_price:
+                    sale_price = price_val
+                    break
+        
+        # Fallback: if only one price found, try to get it from main price element
+        if not sale_price and not regular_price:
+            price_elem = item.select_one(_SEL_MAIN_PRICE)
+            if price_elem:
+                price_text = price_elem.get_text(strip=True)
+                sale_price = self.parse_price(price_text)
+        
+        return regular_price, sale_price
+    
+    @staticmethod
+    def _normalize_price_order(regular_price: Optional[Decimal], sale_price: Optional[Decimal]) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """Ensure sale price is below regular price, swapping or clearing as needed."""
+        if regular_price and sale_price:
+            if sale_price > regular_price:
+                # Prices are likely swapped, swap them back
+                regular_price, sale_price = sale_price, regular_price
+            elif sale_price == regular_price:
+                # No actual discount, clear regular price
+                regular_price = None
+        return regular_price, sale_price
+    
+    def _extract_image_url(self, item) -> Optional[str]:
+        """Extract an absolute image URL from a product item."""
+        img_elem = item.select_one(_SEL_IMG)
+        image_url = None
+        if img_elem:
+            image_url = img_elem.get('src') or img_elem.get('data-src')
+            if image_url and not image_url.startswith('http'):
+                image_url = f"{self.BASE_URL}{image_url}"
+        return image_url
+    
+    def _extract_source_url(self, item) -> Optional[str]:
+        """Extract an absolute product link from a product item."""
+        link_elem = item.select_one(_SEL_LINK)
+        source_url = None
+        if link_elem:
+            href = link_elem.get('href')
+            if href:
+                source_url = f"{self.BASE_URL}{href}" if not href.startswith('http') else href
+        return source_url
+    
+    async def _assign_categories(self, pending_categories: List[Tuple[GroceryDeal, str]]) -> None:
+        """
+        Resolve category names to IDs in one batch and set them on the deals.
+        
+        Args:
+            pending_categories: (deal, category_name) pairs collected while parsing
+        """
+        if not pending_categories:
+            return
+        
+        names = list({name for _, name in pending_categories})
+        results = await asyncio.gather(
+            *(self.get_or_create_category(name) for name in names),
+            return_exceptions=True
+        )
+        
+        category_ids = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, Exception):
+                # Database errors shouldn't drop the deal, only its category
+                print(f"⚠️  Error resolving category '{name}': {result}")
+            else:
+                category_ids[name] = result
+        
+        for deal, name in pending_categories:
+            deal.category_id = category_ids.get(name)
+    
+    async def _fetch_page(self, url: str) -> bytes:
+        """
+        Fetch a page body as raw bytes.
+        
+        Streaming into a single bytes buffer skips httpx's decoded str copy;
+        lxml does its own charset detection on the bytes.
+        """
+        async with self.client.stream('GET', url) as response:
+            response.raise_for_status()
+            return await response.aread()
+    
+    async def scrape_weekly_ads(self) -> List[GroceryDeal]:
+        """Scrape weekly ads/specials."""
+        deals = []
+        
+        try:
+            print(f"📰 Scraping weekly ads from {self.WEEKLY_ADS_URL}...")
+            soup = BeautifulSoup(await self._fetch_page(self.WEEKLY_ADS_URL), 'lxml')
+            
+            # Find product items (adjust selectors based on actual HTML structure)
+            # Common patterns: product-item, product-card, deal-item, etc.
+            product_items = soup.select(_SEL_PRODUCT)
+            
+            if not product_items:
+                # Try alternative selectors
+                product_items = soup.find_all('div', attrs={'data-product': True})
+            
+            # Resolve the store only when there are products to stamp with its ID
+            store = await self.ensure_store() if product_items else None
+            
+            # Get current week's date range (typically weekly ads run Sun-Sat)
+            valid_from, valid_to = _week_bounds(date.today().toordinal())
+            pending_categories = []
+            
+            for item in product_items:
+                try:
+                    # Extract product name
+                    name_elem = item.select_one(_SEL_TITLE)
+                    if not name_elem:
+                        name_elem = item.select_one(_SEL_PRODUCT_LINK)
+                    
+                    if not name_elem:
+                        continue
+                    
+                    product_name = name_elem.get_text(strip=True)
+                    if not product_name:
+                        continue
+                    
+                    # Extract prices - look for both regular and sale prices
+                    regular_price, sale_price = self._extract_prices(item)
+                    
+                    # Extract image URL and link
+                    image_url = self._extract_image_url(item)
+                    source_url = self._extract_source_url(item)
+                    
+                    # Extract description
+                    desc_elem = item.select_one(_SEL_DESC)
+                    description = desc_elem.get_text(strip=True) if desc_elem else None
+                    
+                    # Extract category name; IDs are resolved in one batch after the loop
+                    category_elem = item.select_one(_SEL_CATEGORY)
+                    category_name = category_elem.get_text(strip=True) if category_elem else None
+                    
+                    # Extract unit and quantity
+                    unit, quantity = self.extract_unit_and_quantity(product_name, description or "")
+                    
+                    # Validate and fix price order - sale price should be <= regular price
+                    regular_price, sale_price = self._normalize_price_order(regular_price, sale_price)
+                    
+                    # Calculate discount (only if we have both prices and sale < regular)
+                    discount_percentage = self.calculate_discount(regular_price, sale_price)
+                    
+                    if sale_price:  # Only create deal if we have a price
+                        deal = GroceryDeal(
+                            store_id=store.id,
+                            product_name=product_name,
+                            category_id=None,
+                            regular_price=regular_price,
+                            sale_price=sale_price,
+                            unit=unit,
+                            quantity=quantity,
+                            discount_percentage=discount_percentage,
+                            valid_from=valid_from,
+                            valid_to=valid_to,
+                            source_url=source_url,
+                            image_url=image_url,
+                            description=description
+                        )
+                        deals.append(deal)
+                        if category_name:
+                            pending_categories.append((deal, category_name))
+                        
+                except (AttributeError, InvalidOperation, ValueError, TypeError) as e:
+                    logger.debug("Error parsing product item: %s", e)
+                    continue
+            
+            await self._assign_categories(pending_categories)
+            
+            print(f"✅ Found {len(deals)} deals in weekly ads")
+            
+        except Exception as e:
+            print(f"❌ Error scraping weekly ads: {e}")
+        
+        return deals
+    
+    async def scrape_flash_sale(self) -> List[GroceryDeal]:
+        """Scrape flash sale items."""
+        deals = []
+        
+        try:
+            print(f"⚡ Scraping flash sale from {self.FLASH_SALE_URL}...")
+            soup = BeautifulSoup(await self._fetch_page(self.FLASH_SALE_URL), 'lxml')
+            
+            # Flash sales typically have limited time (e.g., 24-48 hours)
+            valid_from, valid_to = _flash_sale_window(date.today().toordinal())
+            
+            # Similar parsing logic as weekly ads
+            product_items = soup.select(_SEL_FLASH_PRODUCT)
+            
+            # Resolve the store only when there are products to stamp with its ID
+            store = await self.ensure_store() if product_items else None
+            
+            for item in product_items:
+                try:
+                    # Similar extraction logic as weekly_ads
+                    name_elem = item.select_one(_SEL_FLASH_TITLE)
+                    if not name_elem:
+                        continue
+                    
+                    product_name = name_elem.get_text(strip=True)
+                    if not product_name:
+                        continue
+                    
+                    # Extract prices - look for both regular and sale prices
+                    regular_price, sale_price = self._extract_prices(item)
+                    
+                    if not sale_price:
+                        continue
+                    
+                    # Extract other details
+                    image_url = self._extract_image_url(item)
+                    source_url = self._extract_source_url(item)
+                    
+                    unit, quantity = self.extract_unit_and_quantity(product_name)
+                    
+                    # Validate and fix price order - sale price should be <= regular price
+                    regular_price, sale_price = self._normalize_price_order(regular_price, sale_price)
+                    
+                    # Calculate discount (only if we have both prices and sale < regular)
+                    discount_percentage = self.calculate_discount(regular_price, sale_price)
+                    
+                    deal = GroceryDeal(
+                        store_id=store.id,
+                        product_name=product_name,
+                        regular_price=regular_price,
+                        sale_price=sale_price,
+                        unit=unit,
+                        quantity=quantity,
+                        discount_percentage=discount_percentage,
+                        valid_from=valid_from,
+                        valid_to=valid_to,
+                        source_url=source_url,
+                        image_url=image_url,
+                        description="Flash Sale Item"
+                    )
+                    deals.append(deal)
+                    
+                except (AttributeError, InvalidOperation, ValueError, TypeError) as e:
+                    logger.debug("Error parsing flash sale item: %s", e)
+                    continue
+            
+            print(f"✅ Found {len(deals)} flash sale deals")
+            
+        except Exception as e:
+            print(f"❌ Error scraping flash sale: {e}")
+        
+        return deals
+    
+    async def scrape_deals(self) -> List[GroceryDeal]:
+        """
+        Scrape deals from Hmart.
+        
+        Combines deals from weekly ads and flash sales.
+        """
+        # Weekly ads and flash sales are independent pages, fetch them together
+        weekly_deals, flash_deals = await asyncio.gather(
+            self.scrape_weekly_ads(),
+            self.scrape_flash_sale()
+        )
+        all_deals = weekly_deals + flash_deals
+        
+        # Remove duplicates based on product name and store_id, keeping the first occurrence
+        unique_deals = {}
+        for deal in all_deals:
+            unique_deals.setdefault((deal.product_name.strip().casefold(), deal.store_id), deal)
+        
+        return list(unique_deals.values())
+    
+    async def close(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+
+async def main():
+    """Main entry point for Hmart scraper."""
+    scraper = HmartScraper()
+    try:
+        saved_paths = await scraper.run()
+        print(f"\n✅ Scraping complete! Saved {len(saved_paths)} deals.")
+        return saved_paths
+    finally:
+        await scraper.client.aclose()
+
+
+if __name__ == '__main__':
+    run(main())
+
@@ -0,0 +1,194 @@
+"""
+Scrape grocery deals from various stores.
+
+This is a framework for scraping weekly grocery deals. Each store
+should have its own scraper implementation.
+"""
+
+import asyncio
+import re
+from typing import Dict, List, Optional
+
+from ..database import get_pool, close_pool
+from ..services.store_service import StoreService
+from ..models.grocery import GroceryDeal, Store
+from ..utils.event_loop import run
+from .base_scraper import BaseGroceryScraper
+from .hmart import HmartScraper
+from .stew_leonards import StewLeonardsScraper
+
+
+class ExampleScraper(BaseGroceryScraper):
+    """
+    Example scraper implementation.
+    
+    This is a template for creating store-specific scrapers.
+    Replace this with actual scraping logic for each store.
+    """
+    
+    async def scrape_deals(self) -> list[GroceryDeal]:
+        """
+        Scrape deals from the store.
+        
+        This is where you would implement the actual web scraping logic
+        using BeautifulSoup, Selenium, or API calls.
+        
+        Returns:
+            List of GroceryDeal objects
+        """
+        # Example: This would be replaced with actual scraping logic
+        # For now, return empty list as placeholder
+        deals = []
+        
+        # Example deal structure:
+        # deal = GroceryDeal(
+        #     store_id=(await self.ensure_store()).id,
+        #     product_name="Organic Milk",
+        #     regular_price=Decimal("5.99"),
+        #     sale_price=Decimal("4.99"),
+        #     unit="gallon",
+        #     quantity=Decimal("1"),
+        #     valid_from=date.today(),
+        #     valid_to=date(2025, 1, 7),
+        #     source_url="https://example.com/deal/123",
+        #     description="Organic whole milk on sale"
+        # )
+        # deals.append(deal)
+        
+        return deals
+
+
+def canonical_store_name(store_name: str) -> str:
+    """
+    Normalize a store name for lookups and output directories.
+    
+    Example:
+        >>> canonical_store_name("Stew Leonard's")
+        'stew_leonards'
+    """
+    return re.sub(r'[^a-z0-9]+', '_', store_name.lower().replace("'", '')).strip('_')
+
+
+def get_scraper_class(store_name: str) -> type[BaseGroceryScraper]:
+    """Get the scraper class for a store, falling back to ExampleScraper."""
+    return SCRAPERS.get(canonical_store_name(store_name), ExampleScraper)
+
+
+async def scrape_store(
+    store_name: str,
+    scraper_class: type[BaseGroceryScraper],
+    ndjson: bool = False,
+    load_directly: bool = False
+):
+    """
+    Scrape deals from a specific store.
+    
+    Args:
+        store_name: Name of the store
+        scraper_class: Scraper class to use
+        ndjson: If True, save the run as a single NDJSON file
+        load_directly: If True, insert deals into the database instead of
+            staging them as JSON (an NDJSON archive is still written)
+    
+    Returns:
+        Saved file paths, or inserted deal UUIDs when load_directly is set
+    """
+    scraper = scraper_class(store_name=store_name, output_dir=canonical_store_name(store_name))
+    if load_directly:
+        return await scraper.run_and_load()
+    return await scraper.run(ndjson=ndjson)
+
+
+# Map canonical store names to scraper classes
+SCRAPERS = {
+    'hmart': HmartScraper,
+    'h_mart': HmartScraper,
+    'stew_leonards': StewLeonardsScraper,
+    'stew_leonard': StewLeonardsScraper,
+}
+
+ALL_STORES = ['Stop and Shop', 'Hmart', 'Stew Leonards', 'Foodtown', 'Costco', "Decicco's"]
+
+
+async def scrape_all_stores(
+    stores: Optional[List[str]] = None,
+    ndjson: bool = False,
+    load_directly: bool = False
+) -> Dict[str, List[str]]:
+    """
+    Scrape all stores concurrently.
+    
+    Each store runs in its own task, so a slow or failing site does not
+    hold up the others.
+    
+    Args:
+        stores: Store names to scrape (defaults to ALL_STORES)
+        ndjson: If True, save each store's run as a single NDJSON file
+        load_directly: If True, insert deals into the database as each store finishes
+    
+    Returns:
+        Mapping of store name to saved JSON paths, or inserted UUIDs when
+        load_directly is set (empty for failed stores)
+    """
+    stores = stores or ALL_STORES
+    
+    async def scrape_one(store_name: str) -> List[str]:
+        print(f"🔍 Scraping {store_name}")
+        try:
+            return await scrape_store(
+                store_name, get_scraper_class(store_name),
+                ndjson=ndjson, load_directly=load_directly
+            )
+        except Exception as e:
+            print(f"❌ Error scraping {store_name}: {e}")
+            return []
+    
+    results = await asyncio.gather(*(scrape_one(store_name) for store_name in stores))
+    
+    print(f"\n{'='*60}")
+    for store_name, saved_paths in zip(stores, results, strict=True):
+        print(f"  {store_name}: {len(saved_paths)} {'deals inserted' if load_directly else 'files saved'}")
+    print(f"{'='*60}")
+    
+    return dict(zip(stores, results, strict=True))
+
+
+async def main():
+    """Main entry point for the scraper."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape grocery deals from stores')
+    parser.add_argument('--store', type=str, help='Store name to scrape')
+    parser.add_argument('--all', action='store_true', help='Scrape all stores')
+    parser.add_argument('--ndjson', action='store_true', help='Save each run as one NDJSON file')
+    parser.add_argument(
+        '--load-directly',
+        action='store_true',
+        help='Insert scraped deals into the database instead of staging JSON files'
+    )
+    
+    args = parser.parse_args()
+    
+    if not (args.all or args.store):
+        parser.print_help()
+        return
+    
+    # Scrapers only touch the database for store lookups (and bulk inserts)
+    await get_pool(min_size=2, max_size=4)
+    
+    try:
+        if args.all:
+            await scrape_all_stores(ndjson=args.ndjson, load_directly=args.load_directly)
+        else:
+            # Scrape specific store
+            await scrape_store(
+                args.store, get_scraper_class(args.store),
+                ndjson=args.ndjson, load_directly=args.load_directly
+            )
+    finally:
+        await close_pool()
+
+
+if __name__ == '__main__':
+    run(main())
+
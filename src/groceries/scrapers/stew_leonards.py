@@ -0,0 +1,1303 @@
+"""
+Stew Leonard's scraper for shopnow.stewleonards.com
+
+Scrapes weekly specials from Stew Leonard's Shopify-based website.
+"""
+
+import asyncio
+import os
+import re
+import tempfile
+import time
+import traceback
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from pathlib import Path
+
+from bs4 import BeautifulSoup, SoupStrainer
+import httpx
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from ..config import app_config
+from ..models.grocery import GroceryDeal, Category
+from ..services.category_service import CategoryService
+from ..utils.event_loop import run
+from .base_scraper import BaseGroceryScraper
+
+
+# Request headers shared by the HTTP client and the Playwright browser context
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5'
+}
+
+# Product links only exist once the product grid has rendered (nav/menu markup never matches)
+RENDERED_PRODUCT_SELECTOR = 'a[href*="/products/" i]'
+
+# Number within price text, allowing thousands separators
+_PRICE_RE = re.compile(r'(\d[\d,]*\.?\d*)')
+
+# Class or parent-text hints that a price element is the regular or the sale price
+_REGULAR_INDICATORS = ('regular', 'original', 'was', 'list', 'before', 'compare', 'strike', 'del')
+_SALE_INDICATORS = ('sale', 'discount', 'now', 'special', 'deal', 'price', 'current')
+# Each indicator set as one alternation, so a string is scanned once rather than once per word
+_REGULAR_INDICATOR_RE = re.compile('|'.join(map(re.escape, _REGULAR_INDICATORS)))
+_SALE_INDICATOR_RE = re.compile('|'.join(map(re.escape, _SALE_INDICATORS)))
+
+# Decimal constants for discount percentages
+_HUNDRED = Decimal(100)
+_CENT = Decimal('0.01')
+
+# Common units, longest first so the alternation prefers 'lbs' over 'lb'
+UNITS = ['lbs', 'lb', 'oz.', 'oz', 'kg', 'g', 'each', 'pack', 'pkg', 'pcs', 'pk', 'count', 'ct']
+# Quantity followed by any unit, matched in a single pass over lowercased text
+_UNIT_RE = re.compile(r'(\d+\.?\d*)\s*(' + '|'.join(re.escape(u) for u in UNITS) + r')\b')
+
+# Leading "/lb Save", "lbSave", "Save", "low carb" etc. A sequence of optional groups
+# strips them exactly as applying each prefix removal in turn would
+_NAME_PREFIX_RE = re.compile(
+    r'^(?:/lb\s*Save\s+)?(?:/lbSave\s*)?(?:lb\s*Save\s+)?(?:lbSave\s*)?'
+    r'(?:(?-i:/lb)\s*)?(?:lb\s*)?(?:Save\s+)?(?:low\s+carb\s*)?\s*',
+    re.I
+)
+_NAME_SUFFIX_RE = re.compile(r'\s+Save\s*$', re.I)
+_NAME_LEADING_DASH_RE = re.compile(r'^[/\-]\s*')
+
+# Prices with units are removed from product names first, so "3.99 lb" goes as a whole
+_NAME_UNIT_PRICE_RE = re.compile(r'\$?\d+\.?\d*\s*(?:per\s+)?(?:pound|lb|oz|each|pack|ct|count|pcs|pk|pkg)\b', re.I)
+# Then price labels, estimate markers and any remaining prices, in one pass
+_NAME_ARTIFACTS_RE = re.compile(
+    r'current\s+price:?\s*\$?\d+\.?\d*'
+    r'|original\s+price:?\s*\$?\d+\.?\d*'
+    r'|\(estimated\)'
+    r'|\(est\.\)'
+    r'|\$?\d+\.?\d*',
+    re.I
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Lowercase starts of names that are really price text
+_PRICE_TEXT_PREFIXES = ('current price', 'original price', 'estimated')
+# ...or otherwise not a product name once the final prefixes are gone
+_INVALID_NAME_PREFIXES = _PRICE_TEXT_PREFIXES + ('per pack',)
+
+# Prefixes stripped once more after validation: leading / or -, lbSave, lb Save,
+# any remaining lb, then any remaining Save. Each optional group is tried in turn,
+# exactly as applying the removals one after another would
+_NAME_FINAL_PREFIX_RE = re.compile(
+    r'^(?:[/\-]\s*)?(?:[Ll][Bb][Ss]ave\s*)?(?:[Ll][Bb]\s*[Ss]ave\s*)?(?:[Ll][Bb]\s*)?(?:[Ss]ave\s*)?'
+)
+
+# "Original Price: $X.XX" / "Was $X.XX" style regular price hints
+_ORIGINAL_PRICE_RES = [
+    re.compile(r'original\s+price:?\s*\$(\d+\.?\d*)', re.I),
+    re.compile(r'was\s+\$(\d+\.?\d*)', re.I),
+    re.compile(r'compare\s+at:?\s*\$(\d+\.?\d*)', re.I),
+    re.compile(r'list\s+price:?\s*\$(\d+\.?\d*)', re.I),
+]
+
+# Lowercase text marking cookie banners and other page chrome rather than products
+_CONSENT_TOKENS = ('cookie', 'consent')
+_BAD_TEXT_TOKENS = _CONSENT_TOKENS + ('announcement',)
+_BAD_CARD_TOKENS = _BAD_TEXT_TOKENS + ('banner',)
+_POLICY_TOKENS = _CONSENT_TOKENS + ('privacy', 'policy')
+
+# Lowercase markers that rule an element out as a product name
+_BAD_CLASS_TOKENS = ('price', 'cost')
+_BAD_NAME_TOKENS = ('price', 'estimated', 'est.')
+_BAD_FALLBACK_NAME_TOKENS = ('price', 'estimated')
+
+
+def _is_noise(text_lower: str, tokens: Tuple[str, ...] = _BAD_TEXT_TOKENS) -> bool:
+    """Check whether lowercased text contains any of the given noise tokens."""
+    return any(token in text_lower for token in tokens)
+
+
+def _is_container(tag) -> bool:
+    """find_all filter for any div/article/li/section."""
+    return tag.name in _CONTAINER_TAGS
+
+
+def _is_card_tag(tag) -> bool:
+    """find_all filter for any div/article/li."""
+    return tag.name in _CARD_TAGS
+
+
+def _is_product_card(tag) -> bool:
+    """find_all filter for a div/article/li with a product/item/card/deal/special class."""
+    return tag.name in _CARD_TAGS and _PRODUCT_CARD_CLASS_RE.search(' '.join(tag.get('class', ()))) is not None
+
+
+def _is_product_grid(tag) -> bool:
+    """find filter for a div/section with a grid/products/specials/deals class."""
+    return tag.name in _GRID_TAGS and _PRODUCT_GRID_CLASS_RE.search(' '.join(tag.get('class', ()))) is not None
+
+
+def _absolute_image_url(image_url: str) -> str:
+    """Resolve a protocol-relative or relative image URL against the Shopify storefront."""
+    if image_url.startswith('http'):
+        return image_url
+    if image_url.startswith('//'):
+        return f"https:{image_url}"
+    if image_url.startswith('/'):
+        return f"https://shopnow.stewleonards.com{image_url}"
+    return f"https://shopnow.stewleonards.com/{image_url}"
+
+
+def _starts_with_price(text: str) -> bool:
+    """Check whether text starts with a number or a dollar amount, without a regex."""
+    if not text:
+        return False
+    if text[0] == '$':
+        return text[1:2].isdecimal()
+    return text[0].isdecimal()
+
+
+def _tagged_descendants(item) -> List[Tuple[object, str, str]]:
+    """
+    Walk an item's subtree once, keeping each tag with its name and class string.
+    
+    Args:
+        item: BeautifulSoup element for a product item
+        
+    Returns:
+        List of (element, tag name, space-joined classes) in document order
+    """
+    return [(el, el.name, ' '.join(el.get('class', ()))) for el in item.find_all(True)]
+
+
+def _select_tagged(tagged: list, tags: frozenset, class_re: Optional[re.Pattern] = None) -> list:
+    """
+    Filter tagged descendants by tag name and, optionally, a class pattern.
+    
+    Matches what find_all(tags, class_=class_re) returns, in document order.
+    """
+    return [el for el, name, classes in tagged if name in tags and (class_re is None or class_re.search(classes))]
+
+
+def _first_tagged(tagged: list, tags: frozenset, class_re: Optional[re.Pattern] = None):
+    """Return the first tagged descendant find(tags, class_=class_re) would, or None."""
+    return next(
+        (el for el, name, classes in tagged if name in tags and (class_re is None or class_re.search(classes))),
+        None
+    )
+
+
+# First <title> element's text in raw HTML
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]*)</title>', re.I)
+
+# Patterns used while walking product markup
+_WEEKLY_SPECIAL_TEXT_RE = re.compile(r'shop.*all.*weekly.*special', re.I)
+# Parse only what each page is searched for: a store page's links, and a specials
+# page's title and body (the head's scripts and styles never hold products)
+_STORE_PAGE_STRAINER = SoupStrainer(['a', 'link'])
+_SPECIALS_PAGE_STRAINER = SoupStrainer(['title', 'body'])
+# Every weekly specials link match requires this in the href
+_SEL_SPECIALS_LINK = 'a[href*="weekly-specials" i]'
+_SEL_PRODUCT_LINK = 'a[href*="/products/" i]'
+_CONTAINER_TAGS = frozenset(('div', 'article', 'li', 'section'))
+_CARD_TAGS = frozenset(('div', 'article', 'li'))
+_GRID_TAGS = frozenset(('div', 'section'))
+_PRODUCT_HREF_RE = re.compile(r'/product|/products', re.I)
+_PRODUCT_LINK_HREF_RE = re.compile(r'/product', re.I)
+_PRODUCT_CARD_CLASS_RE = re.compile(r'product|item|card|deal|special', re.I)
+_PRODUCT_GRID_CLASS_RE = re.compile(r'grid|products|specials|deals', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|name|product', re.I)
+_NAMELIKE_CLASS_RE = re.compile(r'name|title|heading', re.I)
+_HEADING_TAGS = frozenset(('h2', 'h3', 'h4', 'h5', 'h6'))
+_TITLE_CANDIDATE_TAGS = frozenset(('h2', 'h3', 'h4', 'h5', 'a'))
+_SPAN_DIV_TAGS = frozenset(('span', 'div'))
+_PRICE_TAGS = frozenset(('span', 'div', 'p', 'strong'))
+_MAIN_PRICE_TAGS = frozenset(('span', 'div', 'p'))
+_STRIKE_STYLE_TAGS = frozenset(('span', 'div', 'del', 's'))
+_DESC_TAGS = frozenset(('p', 'div', 'span'))
+_CATEGORY_TAGS = frozenset(('a', 'span'))
+_PRICE_CLASS_RE = re.compile(r'price|cost|amount|money', re.I)
+_MAIN_PRICE_CLASS_RE = re.compile(r'price|cost', re.I)
+_SHOPIFY_PRICE_CLASS_RE = re.compile(r'product.*price|compare.*price|sale.*price', re.I)
+_STRIKE_STYLE_RE = re.compile(r'line-through|text-decoration.*line', re.I)
+_STRIKE_CLASS_RE = re.compile(r'strike|original|was|regular|list|compare', re.I)
+_DESC_CLASS_RE = re.compile(r'desc|description|summary|excerpt', re.I)
+_CATEGORY_CLASS_RE = re.compile(r'category|tag|collection', re.I)
+_PRICE_LIKE_RE = re.compile(r'\$?\d+\.?\d*')
+_PRICE_IN_TEXT_RE = re.compile(r'\$?\s*(\d+\.?\d*)')
+_DOLLAR_PRICE_RE = re.compile(r'\$(\d+\.?\d*)')
+
+# Weekly specials run for a week, so a discovered URL is reused for slightly less
+URL_CACHE_TTL_SECONDS = 6 * 24 * 60 * 60
+
+
+def _read_json_cache(path: Path) -> dict:
+    """Load a JSON cache file, returning an empty dict if missing or unreadable."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json_cache(path: Path, data: dict) -> None:
+    """Write a JSON cache file atomically via a temp file and rename."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"⚠️  Could not write cache {path}: {e}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price_text: str) -> Optional[Decimal]:
+    """Parse a non-empty price string; cached because the same prices repeat across a page."""
+    # Extract number; thousands separators are matched in place and dropped
+    match = _PRICE_RE.search(price_text)
+    if not match:
+        return None
+    number = match.group(1).replace(',', '')
+    # Handle Shopify price format where $799 means $7.99 (cents format)
+    # If price is >= 100 and no decimal, it's likely in cents format
+    if '.' not in number and int(number) >= 100:
+        return Decimal(number) / 100
+    return Decimal(number)
+
+
+def clean_product_name(product_name: str) -> str:
+    """
+    Strip Shopify price-badge prefixes, prices and artifacts from a product name.
+    
+    Args:
+        product_name: Raw product name text
+        
+    Returns:
+        Cleaned product name (may be empty)
+    """
+    product_name = _NAME_PREFIX_RE.sub('', product_name, count=1)
+    product_name = _NAME_SUFFIX_RE.sub('', product_name)
+    product_name = _NAME_LEADING_DASH_RE.sub('', product_name, count=1)
+    product_name = _NAME_UNIT_PRICE_RE.sub('', product_name)
+    product_name = _NAME_ARTIFACTS_RE.sub('', product_name)
+    return _WHITESPACE_RE.sub(' ', product_name).strip()
+
+
+class StewLeonardsScraper(BaseGroceryScraper):
+    """
+    Stew Leonard's scraper implementation.
+    
+    Scrapes deals from stewleonards.com including:
+    - Weekly specials from store location pages
+    """
+    
+    BASE_URL = "https://stewleonards.com"
+    DEFAULT_STORE_URL = f"{BASE_URL}/stew-leonards-locations/yonkers-store/"
+    # Last-resort scan of every container for price-like text when no other strategy finds products
+    SCAN_ALL_CONTAINERS = True
+    
+    def __init__(self, store_name: str = "Stew Leonard's", output_dir: Optional[str] = None, url: Optional[str] = None):
+        """Initialize Stew Leonard's scraper.
+        
+        Args:
+            store_name: Name of the store
+            output_dir: Output directory for JSON files
+            url: Optional specific store location URL to scrape (defaults to Yonkers store)
+        """
+        super().__init__(store_name, output_dir or "stew_leonards")
+        self.website_url = self.BASE_URL
+        self.specific_url = url or self.DEFAULT_STORE_URL  # Store URL, default to Yonkers
+        # Use httpx for simple requests (store page)
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            headers=BROWSER_HEADERS,
+            follow_redirects=True
+        )
+        # Specials URLs persisted between runs under data/stage/<output_dir>/.cache/ (skipped by the loader)
+        self._cache_dir = Path("data/stage") / self.output_dir / ".cache"
+        self._url_cache_path = self._cache_dir / "url_cache.json"
+        self._url_cache = _read_json_cache(self._url_cache_path)
+        # Category ids resolved during this run; never persisted, since ids from
+        # an earlier run may no longer exist in the database
+        self.categories_cache = {}
+        # Category lookups in flight, by name
+        self._category_lookups = {}
+        # Per-item diagnostics, HTML dumps and tracebacks are only produced with DEBUG=true
+        self.debug = app_config.debug
+        # Playwright browser shared by all rendered page loads, launched lazily
+        self._playwright = None
+        self._browser = None
+        self._browser_context = None
+        self._browser_lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def _get_browser_context(self):
+        """Launch the shared Playwright browser and context on first use."""
+        async with self._browser_lock:
+            if self._browser_context is None:
+                try:
+                    self._playwright = await async_playwright().start()
+                    self._browser = await self._playwright.chromium.launch(headless=True)
+                    self._browser_context = await self._browser.new_context(extra_http_headers=BROWSER_HEADERS)
+                except BaseException:
+                    # Don't leak the driver process when launch or new_context fails
+                    await self._close_browser()
+                    raise
+        return self._browser_context
+    
+    async def _close_browser(self):
+        """Close whichever of the browser context, browser and Playwright driver were started."""
+        context, browser, playwright = self._browser_context, self._browser, self._playwright
+        self._playwright = self._browser = self._browser_context = None
+        try:
+            if context is not None:
+                await context.close()
+            if browser is not None:
+                await browser.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
+    
+    async def get_rendered_html(self, url: str) -> str:
+        """Get fully rendered HTML from a JavaScript-rendered page using Playwright."""
+        context = await self._get_browser_context()
+        page = await context.new_page()
+        try:
+            # Use 'domcontentloaded' instead of 'networkidle' for faster loading
+            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            
+            # Wait for product elements to render instead of sleeping a fixed time
+            try:
+                await page.wait_for_selector(RENDERED_PRODUCT_SELECTOR, timeout=10000)
+            except PlaywrightTimeoutError:
+                pass  # Continue even if selector doesn't appear
+            
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')  # Scroll to trigger lazy loading
+            # Wait for lazy-loaded requests to settle
+            try:
+                await page.wait_for_load_state('networkidle', timeout=5000)
+            except PlaywrightTimeoutError:
+                pass  # Keep whatever has loaded so far
+            html = await page.content()
+        except Exception as e:
+            print(f"⚠️  Error loading page with Playwright: {e}")
+            # Try to get HTML even if there was an error
+            try:
+                html = await page.content()
+            except:
+                html = ""
+        finally:
+            await page.close()
+        return html
+    
+    async def get_or_create_category(self, category_name: str) -> Optional[int]:
+        """
+        Get or create a category and return its ID.
+        
+        Resolved ids are kept in categories_cache. A lookup still in flight is
+        shared, so concurrent items with the same category make a single
+        database round-trip.
+        """
+        category_id = self.categories_cache.get(category_name)
+        if category_id is not None:
+            return category_id
+        
+        task = self._category_lookups.get(category_name)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup_category_id(category_name))
+            self._category_lookups[category_name] = task
+        try:
+            category_id = await asyncio.shield(task)
+        finally:
+            if task.done() and self._category_lookups.get(category_name) is task:
+                del self._category_lookups[category_name]
+        
+        # Only found ids are cached, so a failed lookup is retried by the next item
+        if category_id is not None:
+            self.categories_cache[category_name] = category_id
+        return category_id
+    
+    @staticmethod
+    async def _lookup_category_id(category_name: str) -> Optional[int]:
+        """Fetch or create a category and return its ID."""
+        category = await CategoryService.get_or_create_category(category_name)
+        if category and category.id:
+            return category.id
+        return None
+    
+    def _cached_specials_url(self, store_page_url: str) -> Optional[str]:
+        """Return a weekly specials URL found for this store page within the TTL."""
+        entry = self._url_cache.get(store_page_url)
+        if not isinstance(entry, dict) or not entry.get('url'):
+            return None
+        if time.time() - entry.get('found_at', 0) >= URL_CACHE_TTL_SECONDS:
+            return None
+        return entry['url']
+    
+    def _remember_specials_url(self, store_page_url: str, specials_url: str) -> None:
+        """Persist a confirmed weekly specials URL for this store page."""
+        self._url_cache[store_page_url] = {'url': specials_url, 'found_at': time.time()}
+        _write_json_cache(self._url_cache_path, self._url_cache)
+    
+    @staticmethod
+    def parse_price(price_text: str) -> Optional[Decimal]:
+        """Parse price from text like '$5.99' or '5.99' or '$799' (meaning $7.99)."""
+        if not price_text:
+            return None
+        return _parse_price(price_text)
+    
+    def extract_unit_and_quantity(self, product_name: str, description: str = "") -> Tuple[Optional[str], Optional[Decimal]]:
+        """Extract unit and quantity from product name or description."""
+        unit = None
+        quantity = None
+        
+        # Look for unit patterns
+        text = f"{product_name} {description}".lower()
+        
+        match = _UNIT_RE.search(text)
+        if match:
+            try:
+                quantity = Decimal(match.group(1))
+                unit = match.group(2).rstrip('.')
+            except InvalidOperation:
+                quantity = None
+        
+        return unit, quantity
+    
+    def calculate_discount(self, regular_price: Optional[Decimal], sale_price: Optional[Decimal]) -> Optional[Decimal]:
+        """Calculate discount percentage.
+        
+        Returns positive percentage if sale_price < regular_price (actual discount).
+        Returns None if prices are invalid or sale_price >= regular_price.
+        """
+        if not regular_price or not sale_price or regular_price <= 0:
+            return None
+        
+        # If sale price is higher than regular price, something is wrong - don't calculate discount
+        if sale_price >= regular_price:
+            return None
+        
+        # Calculate discount: ((regular - sale) / regular) * 100
+        discount = (regular_price - sale_price) * _HUNDRED / regular_price
+        return discount.quantize(_CENT)
+    
+    def _find_specials_link(self, html: str) -> Optional[str]:
+        """
+        Find the weekly specials URL in a store page's links.
+        
+        Args:
+            html: Store location page HTML
+            
+        Returns:
+            Weekly specials URL, or None if the page doesn't link to one
+        """
+        soup = BeautifulSoup(html, 'lxml', parse_only=_STORE_PAGE_STRAINER)
+        
+        # First, check for canonical link that points to weekly specials (most reliable)
+        canonical = soup.find('link', rel='canonical')
+        if canonical:
+            canonical_href = canonical.get('href', '')
+            if 'weekly-specials' in canonical_href.lower():
+                print(f"✅ Found weekly specials URL from canonical link: {canonical_href}")
+                return canonical_href
+        
+        # Look for links that go to shopnow.stewleonards.com with collections/weekly-specials
+        # Priority: links with "collections" and "weekly-specials" or "rc-weekly-specials".
+        # Only links whose href mentions weekly-specials can match, so skip the rest up front.
+        candidate_links = soup.select(_SEL_SPECIALS_LINK)
+        for link in candidate_links:
+            href = link.get('href', '')
+            link_text = link.get_text(strip=True).lower()
+        
+            # Check if href contains the weekly specials collection pattern
+            if 'shopnow.stewleonards.com' in href or href.startswith('/store/'):
+                if 'collections' in href and 'weekly-specials' in href.lower():
+                    # Clean up the href
+                    if href.startswith('http'):
+                        full_url = href
+                    elif href.startswith('/'):
+                        full_url = f"https://shopnow.stewleonards.com{href}"
+                    else:
+                        full_url = f"https://shopnow.stewleonards.com/{href}"
+                    print(f"✅ Found weekly specials URL: {full_url}")
+                    return full_url
+        
+            # Also check link text for weekly specials
+            if 'weekly' in link_text and ('special' in link_text or 'ad' in link_text):
+                if href:
+                    # Make sure it's not just the storefront - must have collections/weekly-specials
+                    href_lower = href.lower()
+                    if 'storefront' not in href_lower and 'collections' in href_lower and 'weekly-specials' in href_lower:
+                        # Clean up the href
+                        if href.startswith('http'):
+                            full_url = href
+                        elif href.startswith('/'):
+                            # Check if it's a shopnow URL
+                            if href.startswith('/store/'):
+                                full_url = f"https://shopnow.stewleonards.com{href}"
+                            else:
+                                full_url = f"{self.BASE_URL}{href}"
+                        else:
+                            full_url = f"{self.BASE_URL}/{href}"
+        
+                        # Remove any query parameters that might break the URL
+                        if '?' in full_url:
+                            full_url = full_url.split('?')[0]
+        
+                        print(f"✅ Found weekly specials URL: {full_url}")
+                        return full_url
+        
+        # Fallback: Try to find any link with "Shop All Weekly Specials" text
+        for link in candidate_links:
+            if link.find(string=_WEEKLY_SPECIAL_TEXT_RE):
+                href = link.get('href', '')
+                if href:
+                    # Make sure it's actually a weekly specials collection URL
+                    href_lower = href.lower()
+                    if 'collections' in href_lower and 'weekly-specials' in href_lower:
+                        if href.startswith('http'):
+                            full_url = href
+                        elif href.startswith('/'):
+                            if href.startswith('/store/'):
+                                full_url = f"https://shopnow.stewleonards.com{href}"
+                            else:
+                                full_url = f"{self.BASE_URL}{href}"
+                        else:
+                            full_url = f"{self.BASE_URL}/{href}"
+        
+                        # Remove any query parameters
+                        if '?' in full_url:
+                            full_url = full_url.split('?')[0]
+        
+                        print(f"✅ Found weekly specials URL from text: {full_url}")
+                        return full_url
+        
+        return None
+    
+    async def _fetch_static(self, url: str) -> str:
+        """Fetch a page's raw HTML without rendering it; returns '' on failure."""
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            print(f"⚠️  Error fetching {url}: {e}")
+            return ''
+        return response.text if response.status_code == 200 else ''
+    
+    async def find_weekly_specials_url(self, store_page_url: str) -> Optional[str]:
+        """Find the weekly specials URL from a store location page."""
+        cached_url = self._cached_specials_url(store_page_url)
+        if cached_url:
+            print(f"✅ Using cached weekly specials URL: {cached_url}")
+            return cached_url
+        
+        try:
+            print(f"🔍 Looking for weekly specials link on {store_page_url}...")
+            
+            # The store page is usually static, so try a plain GET before rendering it
+            html = await self._fetch_static(store_page_url)
+            specials_url = self._find_specials_link(html) if html else None
+            
+            if not specials_url:
+                # Use Playwright to render the store page (it may be JavaScript-rendered)
+                html = await self.get_rendered_html(store_page_url)
+                
+                if not html:
+                    print("⚠️  Could not fetch store page")
+                    return None
+                
+                specials_url = self._find_specials_link(html)
+            
+            if specials_url:
+                self._remember_specials_url(store_page_url, specials_url)
+                return specials_url
+            
+            # Fallback: Try to construct URL from current date pattern
+            # Weekly specials URLs follow pattern: rc-weekly-specials-MM-DD-MM-DD
+            # Example: rc-weekly-specials-11-19-12-2 (Nov 19 - Dec 2)
+            print("⚠️  Could not find weekly specials link, trying to construct from date pattern...")
+            today = date.today()
+            
+            # Try multiple date ranges - weekly specials might start on different days
+            # Try current week starting from Sunday
+            days_since_sunday = today.weekday() + 1
+            week_start = today - timedelta(days=days_since_sunday)
+            week_end = week_start + timedelta(days=13)  # 2 weeks
+            
+            # Also try previous week (in case current week hasn't started yet)
+            prev_week_start = week_start - timedelta(days=7)
+            prev_week_end = prev_week_start + timedelta(days=13)
+            
+            # Build current and previous week URLs, current week preferred
+            url_suffix = f"rc-weekly-specials-{week_start.month}-{week_start.day}-{week_end.month}-{week_end.day}"
+            fallback_url = f"https://shopnow.stewleonards.com/store/stew-leonards/collections/{url_suffix}"
+            prev_url_suffix = f"rc-weekly-specials-{prev_week_start.month}-{prev_week_start.day}-{prev_week_end.month}-{prev_week_end.day}"
+            prev_fallback_url = f"https://shopnow.stewleonards.com/store/stew-leonards/collections/{prev_url_suffix}"
+            print(f"⚠️  Trying constructed URLs: {fallback_url}, {prev_fallback_url}")
+            
+            # Verify both URLs concurrently by checking the rendered page titles
+            test_html, prev_test_html = await asyncio.gather(
+                self.get_rendered_html(fallback_url),
+                self.get_rendered_html(prev_fallback_url)
+            )
+            # Only URLs confirmed to be specials pages are cached; guesses are retried next run
+            if self._is_weekly_specials_page(test_html):
+                self._remember_specials_url(store_page_url, fallback_url)
+                return fallback_url
+            if self._is_weekly_specials_page(prev_test_html):
+                self._remember_specials_url(store_page_url, prev_fallback_url)
+                print(f"⚠️  Current week URL didn't work, using previous week: {prev_fallback_url}")
+                return prev_fallback_url
+            if test_html:
+                # Current week loaded but isn't a specials page; previous week is the better guess
+                return prev_fallback_url
+            return fallback_url
+            
+        except Exception as e:
+            print(f"⚠️  Error finding weekly specials URL: {e}")
+            if self.debug:
+                traceback.print_exc()
+            return None
+    
+    @staticmethod
+    def _element_info(element, cache: dict) -> Tuple[str, str, str]:
+        """
+        Get an element's text, lowercased text and lowercased class string.
+        
+        Args:
+            element: BeautifulSoup element
+            cache: Per-item dict so each element's subtree is only walked once
+            
+        Returns:
+            Tuple of (text, lowercased text, lowercased classes)
+        """
+        key = id(element)
+        info = cache.get(key)
+        if info is None:
+            text = element.get_text(strip=True)
+            info = (text, text.lower(), ' '.join(element.get('class') or ()).lower())
+            cache[key] = info
+        return info
+    
+    def _extract_description(self, tagged: list, product_name: str, element_info: dict) -> Optional[str]:
+        """
+        Pick a product item's description from its tagged descendants.
+        
+        One pass over the descendants collects the candidates for every strategy,
+        which are then tried in order.
+        
+        Args:
+            tagged: The item's (element, tag name, class string) descendants
+            product_name: Cleaned product name, which is never used as the description
+            element_info: Per-item element text cache
+            
+        Returns:
+            Description text, or None if no candidate qualifies
+        """
+        desc_elem = None
+        paragraphs = []
+        text_elems = []
+        for el, name, classes in tagged:
+            if name == 'p':
+                paragraphs.append(el)
+            elif name in _SPAN_DIV_TAGS:
+                text_elems.append(el)
+            if desc_elem is None and name in _DESC_TAGS and _DESC_CLASS_RE.search(classes):
+                desc_elem = el
+        
+        description = None
+        # Strategy 1: Look for description/summary classes
+        if desc_elem is not None:
+            description = self._element_info(desc_elem, element_info)[0]
+        
+        # Strategy 2: Look for any paragraph that's not the product name
+        if not description:
+            for p in paragraphs:
+                p_text = self._element_info(p, element_info)[0]
+                # Skip if it's just price or very short
+                if len(p_text) > 20 and not _starts_with_price(p_text):
+                    return p_text
+        
+        # Strategy 3: Look for span/div with longer text that's not the name
+        if not description:
+            product_name_lower = product_name.lower()
+            for elem in text_elems:
+                elem_text, elem_text_lower, _ = self._element_info(elem, element_info)
+                # Skip if it's price, name, or too short
+                if (len(elem_text) > 30 and
+                    not _starts_with_price(elem_text) and
+                    elem_text_lower != product_name_lower and
+                    'price' not in elem_text_lower):
+                    return elem_text
+        
+        return description
+    
+    @staticmethod
+    def _is_weekly_specials_page(html: str) -> bool:
+        """Check whether rendered HTML is a weekly specials collection page.
+        
+        Only the title is needed, so it is sniffed from the raw HTML without
+        parsing the page.
+        """
+        if not html:
+            return False
+        match = _TITLE_RE.search(html)
+        return bool(match and 'weekly special' in match.group(1).lower())
+    
+    async def scrape_weekly_specials(self, url: Optional[str] = None) -> List[GroceryDeal]:
+        """Scrape weekly specials from Stew Leonard's store page or weekly specials page."""
+        deals = []
+        
+        try:
+            # If URL is provided, use it directly
+            if url:
+                # Check if it's a store location page or a weekly specials page
+                if '/stew-leonards-locations/' in url:
+                    # It's a store location page, find the weekly specials link
+                    weekly_specials_url = await self.find_weekly_specials_url(url)
+                    if weekly_specials_url:
+                        url = weekly_specials_url
+                    else:
+                        print("❌ Could not find weekly specials link from store page")
+                        return deals
+                # Otherwise, assume it's already a weekly specials URL (like collections/rc-weekly-specials-*)
+                elif 'collections' in url and 'weekly-specials' in url.lower():
+                    # It's already a weekly specials URL, use it directly
+                    print(f"✅ Using provided weekly specials URL: {url}")
+                # If it's neither, assume it's a weekly specials URL anyway
+            else:
+                # Use default Yonkers store page
+                weekly_specials_url = await self.find_weekly_specials_url(self.DEFAULT_STORE_URL)
+                if weekly_specials_url:
+                    url = weekly_specials_url
+                else:
+                    print("❌ Could not determine weekly specials URL")
+                    return deals
+            
+            print(f"📰 Scraping weekly specials from {url}...")
+            
+            # Use Playwright to get rendered HTML (page is JavaScript-rendered)
+            html = await self.get_rendered_html(url)
+            
+            if not html:
+                print(f"❌ Could not fetch page content from: {url}")
+                return deals
+            
+            soup = BeautifulSoup(html, 'lxml', parse_only=_SPECIALS_PAGE_STRAINER)
+            
+            # Debug: Check page title to confirm we got the right page
+            page_title = soup.find('title')
+            if page_title:
+                print(f"📄 Page title: {page_title.get_text(strip=True)}")
+            
+            # Look for product items - try various selectors for different page structures
+            product_items = []
+            
+            # Strategy 1: Look for Shopify product links (most reliable)
+            product_links = soup.select(_SEL_PRODUCT_LINK)
+            if product_links:
+                # Get unique parent containers for each product link
+                seen_containers = set()
+                for link in product_links:
+                    # Find the product container (usually a parent div) by walking up directly
+                    container = link.parent
+                    while container is not None and container.name not in _CONTAINER_TAGS:
+                        container = container.parent
+                    if container is None or id(container) in seen_containers:
+                        continue
+                    # Each container is checked once, whether or not it passes the filter
+                    seen_containers.add(id(container))
+                    container_text = container.get_text(strip=True).lower()
+                    if not _is_noise(container_text):
+                        product_items.append(container)
+                print(f"🔍 Found {len(product_items)} items from product links")
+            
+            # Strategy 2: Look for elements with data-product attribute (Shopify pattern)
+            if not product_items:
+                data_product_items = soup.find_all(attrs={'data-product': True})
+                for item in data_product_items:
+                    item_text = item.get_text(strip=True).lower()
+                    if not _is_noise(item_text, _CONSENT_TOKENS):
+                        product_items.append(item)
+                print(f"🔍 Found {len(product_items)} items with data-product attribute")
+            
+            # Strategy 3: Look for product cards/items with common class names
+            if not product_items:
+                all_candidates = soup.find_all(_is_product_card)
+                for item in all_candidates:
+                    # Filter out cookie consent and other non-product elements
+                    item_text = item.get_text(strip=True).lower()
+                    item_classes = ' '.join(item.get('class', [])).lower()
+                    if not _is_noise(item_text, _BAD_CARD_TOKENS) and not _is_noise(item_classes, _CONSENT_TOKENS):
+                        # Also check if it has price information (likely a product)
+                        if _PRICE_LIKE_RE.search(item.get_text()):
+                            product_items.append(item)
+                print(f"🔍 Found {len(product_items)} items with product/item/card/deal/special classes (after filtering)")
+            
+            # Strategy 4: Look for items in a product grid
+            if not product_items:
+                product_grid = soup.find(_is_product_grid)
+                if product_grid:
+                    grid_items = product_grid.find_all(_is_card_tag)
+                    for item in grid_items:
+                        item_text = item.get_text(strip=True).lower()
+                        if not _is_noise(item_text):
+                            product_items.append(item)
+                    print(f"🔍 Found {len(product_items)} items in product grid")
+            
+            # Strategy 5: Look for any div/article/li that contains price information.
+            # This visits every container in the page, so it can be switched off.
+            if not product_items and self.SCAN_ALL_CONTAINERS:
+                all_containers = soup.find_all(_is_container)
+                for container in all_containers:
+                    text = container.get_text()
+                    text_lower = text.lower()
+                    # Check if it contains price-like patterns and exclude non-product elements
+                    if _PRICE_LIKE_RE.search(text) and len(text) < 500 and not _is_noise(text_lower, _POLICY_TOKENS):
+                        product_items.append(container)
+                print(f"🔍 Found {len(product_items)} items with price information (after filtering)")
+            
+            if not product_items:
+                print("⚠️  No product items found.")
+                if self.debug:
+                    print("💡 Saving HTML for debugging...")
+                    debug_file = Path("data/stage/stew_leonards_debug.html")
+                    debug_file.parent.mkdir(parents=True, exist_ok=True)
+                    with open(debug_file, 'w', encoding='utf-8') as f:
+                        f.write(html)
+                    print(f"📄 Full HTML saved to: {debug_file}")
+                else:
+                    print("💡 Run with DEBUG=true to save the page HTML for debugging")
+                return deals
+            
+            # Resolve the store only now that there are products to stamp with its ID
+            store = await self.ensure_store()
+            
+            # Get current week's date range (typically weekly ads run Sun-Sat)
+            today = date.today()
+            # Find previous Sunday
+            days_since_sunday = today.weekday() + 1
+            valid_from = today - timedelta(days=days_since_sunday)
+            valid_to = valid_from + timedelta(days=6)
+            
+            print(f"🛒 Processing {len(product_items)} potential product items...")
+            
+            for idx, item in enumerate(product_items, 1):
+                try:
+                    # Extract product name - try multiple strategies
+                    name_elem = None
+                    # Text and class strings of candidate elements, computed once per item
+                    element_info = {}
+                    
+                    # Walk the item's subtree once; the name, price, link, image, description
+                    # and category lookups below all filter this list instead
+                    tagged = _tagged_descendants(item)
+                    
+                    # Strategy 1: Look for link with product in href (most reliable for Shopify)
+                    name_elem = next(
+                        (el for el, name, _ in tagged if name == 'a' and _PRODUCT_HREF_RE.search(el.get('href') or '')),
+                        None
+                    )
+                    
+                    # Strategy 2: Look for heading with title/name/product classes (but not price)
+                    headings = None
+                    if not name_elem:
+                        headings = _select_tagged(tagged, _HEADING_TAGS)
+                        for heading in headings:
+                            heading_raw, heading_text, heading_classes = self._element_info(heading, element_info)
+                            # Exclude price-related headings and common non-product text
+                            if ('$' not in heading_raw and not _is_noise(heading_classes, _BAD_CLASS_TOKENS) and
+                                not _is_noise(heading_text, _BAD_NAME_TOKENS)):
+                                name_elem = heading
+                                break
+                    
+                    # Strategy 3: Look for heading or link with title/name/product classes (exclude price)
+                    if not name_elem:
+                        candidates = _select_tagged(tagged, _TITLE_CANDIDATE_TAGS, _TITLE_CLASS_RE)
+                        for candidate in candidates:
+                            candidate_raw, candidate_text, candidate_classes = self._element_info(candidate, element_info)
+                            # Exclude price-related elements and common artifacts
+                            if ('$' not in candidate_raw and not _is_noise(candidate_classes, _BAD_CLASS_TOKENS) and
+                                not _is_noise(candidate_text, _BAD_NAME_TOKENS)):
+                                name_elem = candidate
+                                break
+                    
+                    # Strategy 4: Look for any heading in the item (but not price-related)
+                    if not name_elem:
+                        for heading in headings:
+                            heading_raw, heading_text, _ = self._element_info(heading, element_info)
+                            if '$' not in heading_raw and not _is_noise(heading_text, _BAD_FALLBACK_NAME_TOKENS):
+                                name_elem = heading
+                                break
+                    
+                    # Strategy 5: Look for span/div with product name pattern (exclude price)
+                    if not name_elem:
+                        candidates = _select_tagged(tagged, _SPAN_DIV_TAGS, _NAMELIKE_CLASS_RE)
+                        for candidate in candidates:
+                            candidate_raw, candidate_text, candidate_classes = self._element_info(candidate, element_info)
+                            if ('$' not in candidate_raw and not _is_noise(candidate_classes, _BAD_CLASS_TOKENS) and
+                                not _is_noise(candidate_text, _BAD_FALLBACK_NAME_TOKENS)):
+                                name_elem = candidate
+                                break
+                    
+                    if not name_elem:
+                        if self.debug and idx <= 5:  # Debug first few items
+                            print(f"  ⚠️  Item {idx}: No name element found")
+                            # Debug: show item HTML snippet
+                            item_html = str(item)
+                            print(f"      Item HTML: {item_html[:200]}...")
+                        continue
+                    
+                    # Try to get name from attributes first (more reliable)
+                    product_name = None
+                    if name_elem.name == 'a':
+                        product_name = name_elem.get('title', '').strip() or name_elem.get('aria-label', '').strip()
+                    
+                    # If no attribute, get from text
+                    if not product_name:
+                        product_name = self._element_info(name_elem, element_info)[0]
+                    
+                    # Clean up product name - remove various prefixes and price patterns
+                    if product_name:
+                        product_name = clean_product_name(product_name)
+                        
+                        # Skip if name looks like it's just price text or artifacts
+                        if len(product_name) < 3 or product_name.lower().startswith(_PRICE_TEXT_PREFIXES):
+                            product_name = None
+                        else:
+                            # Final cleanup - remove any remaining prefixes that might have been missed
+                            product_name = _NAME_FINAL_PREFIX_RE.sub('', product_name, count=1).strip()
+                    
+                    # Additional validation - skip if name looks invalid
+                    if product_name:
+                        product_name_lower = product_name.lower()
+                        # Skip if it's clearly not a product name
+                        if (product_name_lower.startswith(_INVALID_NAME_PREFIXES) or
+                            'current price:' in product_name_lower or
+                            'original price:' in product_name_lower):
+                            product_name = None
+                    
+                    if not product_name or len(product_name) < 3:
+                        if self.debug and idx <= 5:  # Debug first few items
+                            print(f"  ⚠️  Item {idx}: Name element found but no valid text")
+                            if name_elem:
+                                print(f"      Name element text: {name_elem.get_text(strip=True)[:50]}")
+                        continue
+                    
+                    if self.debug and idx <= 3:  # Debug first few successful extractions
+                        print(f"  ✅ Item {idx}: Found product name: {product_name[:50]}")
+                    
+                    # Extract prices - Shopify often has price elements
+                    sale_price = None
+                    regular_price = None
+                    
+                    # Find all price-related elements
+                    price_elems = _select_tagged(tagged, _PRICE_TAGS, _PRICE_CLASS_RE)
+                    
+                    # Also look for Shopify-specific price classes
+                    shopify_price_elems = _select_tagged(tagged, _SPAN_DIV_TAGS, _SHOPIFY_PRICE_CLASS_RE)
+                    price_elems.extend(shopify_price_elems)
+                    
+                    # Look for strikethrough text (often indicates regular price)
+                    strikethrough_elems = [
+                        el for el, name, _ in tagged
+                        if name in _STRIKE_STYLE_TAGS and _STRIKE_STYLE_RE.search(el.get('style') or '')
+                    ]
+                    strikethrough_elems.extend(_select_tagged(tagged, _SPAN_DIV_TAGS, _STRIKE_CLASS_RE))
+                    
+                    # Extract regular price from strikethrough or "was/original" elements
+                    for se in strikethrough_elems:
+                        price_text_se = self._element_info(se, element_info)[0]
+                        price_val = self.parse_price(price_text_se)
+                        if price_val and not regular_price:
+                            regular_price = price_val
+                    
+                    # Look through all price elements
+                    for pe in price_elems:
+                        price_text_pe = self._element_info(pe, element_info)[0]
+                        price_val = self.parse_price(price_text_pe)
+                        
+                        if not price_val:
+                            continue
+                        
+                        # Check class names, then parent context, for regular/sale indicators.
+                        # Both strings come from the per-item cache, so sibling price elements
+                        # share their parent's text, and it is skipped when classes decide both
+                        classes = self._element_info(pe, element_info)[2]
+                        is_regular = _REGULAR_INDICATOR_RE.search(classes) is not None
+                        is_sale = _SALE_INDICATOR_RE.search(classes) is not None
+                        if not (is_regular and is_sale) and pe.parent:
+                            parent_text = self._element_info(pe.parent, element_info)[1]
+                            is_regular = is_regular or _REGULAR_INDICATOR_RE.search(parent_text) is not None
+                            is_sale = is_sale or _SALE_INDICATOR_RE.search(parent_text) is not None
+                        
+                        if is_regular and not regular_price:
+                            regular_price = price_val
+                        elif is_sale and not sale_price:
+                            sale_price = price_val
+                        elif not is_regular and not is_sale:
+                            # If ambiguous, assume higher price is regular, lower is sale
+                            if not sale_price:
+                                sale_price = price_val
+                            elif not regular_price:
+                                if price_val > sale_price:
+                                    # Higher price is regular, lower is sale (already correct)
+                                    regular_price = price_val
+                                else:
+                                    # Lower price found, swap: current sale becomes regular, new price is sale
+                                    regular_price = sale_price
+                                    sale_price = price_val
+                    
+                    # Full item text for the text-based fallbacks below, computed at most once
+                    all_text = None
+                    
+                    # If we found a regular price but no sale price, check if there's a lower price
+                    if regular_price and not sale_price:
+                        # Look for any other price that might be the sale price
+                        all_text = item.get_text()
+                        # Candidates are compared as floats; only the chosen one becomes a Decimal.
+                        # The pattern only captures digits and a point, so float() cannot fail.
+                        regular_float = float(regular_price)
+                        for match in _PRICE_IN_TEXT_RE.findall(all_text):
+                            if float(match) < regular_float:
+                                sale_price = Decimal(match)
+                                break
+                    
+                    # Fallback: if only one price found, try to get it from main price element
+                    if not sale_price and not regular_price:
+                        price_elem = _first_tagged(tagged, _MAIN_PRICE_TAGS, _MAIN_PRICE_CLASS_RE)
+                        if price_elem:
+                            price_text = price_elem.get_text(strip=True)
+                            sale_price = self.parse_price(price_text)
+                    
+                    # Last resort: extract all prices from item text and use them
+                    if not sale_price and not regular_price:
+                        if all_text is None:
+                            all_text = item.get_text()
+                        # Find all price patterns in the text (with $ sign), keeping the two
+                        # highest distinct prices in one pass instead of sorting them all
+                        highest = second_highest = None
+                        for match in _DOLLAR_PRICE_RE.finditer(all_text):
+                            # Use parse_price to handle cents format ($799 = $7.99)
+                            parsed_price = self.parse_price(match.group(1))
+                            if not parsed_price or parsed_price == highest or parsed_price == second_highest:
+                                continue
+                            if highest is None or parsed_price > highest:
+                                highest, second_highest = parsed_price, highest
+                            elif second_highest is None or parsed_price > second_highest:
+                                second_highest = parsed_price
+                        
+                        if highest:
+                            if second_highest:
+                                regular_price = highest
+                                sale_price = second_highest
+                            else:
+                                sale_price = highest
+                            
+                            if self.debug and idx <= 3:
+                                print(f"      Extracted prices from text -> Sale: {sale_price}, Regular: {regular_price}")
+                    
+                    # Try to find regular price from "Original Price" or "Was" text patterns
+                    if sale_price and not regular_price:
+                        if all_text is None:
+                            all_text = item.get_text()
+                        # Look for patterns like "Original Price: $X.XX" or "Was $X.XX"
+                        for pattern in _ORIGINAL_PRICE_RES:
+                            match = pattern.search(all_text)
+                            if match:
+                                parsed_price = self.parse_price(f'${match.group(1)}')
+                                if parsed_price and parsed_price > sale_price:
+                                    regular_price = parsed_price
+                                    if self.debug and idx <= 3:
+                                        print(f"      Found regular price from pattern '{pattern.pattern}': {regular_price}")
+                                    break
+                    
+                    # Validate and fix price order - sale price should be <= regular price
+                    if regular_price and sale_price:
+                        if sale_price > regular_price:
+                            # Prices are likely swapped, swap them back
+                            regular_price, sale_price = sale_price, regular_price
+                        elif sale_price == regular_price:
+                            # No actual discount, clear regular price
+                            regular_price = None
+                    
+                    # Extract link (prefer product link) - do this before image extraction
+                    links = [el for el, name, _ in tagged if name == 'a' and el.get('href') is not None]
+                    link_elem = next((el for el in links if _PRODUCT_LINK_HREF_RE.search(el['href'])), None)
+                    if not link_elem and links:
+                        link_elem = links[0]
+                    source_url = None
+                    if link_elem:
+                        href = link_elem.get('href')
+                        if href:
+                            if href.startswith('http'):
+                                source_url = href
+                            elif href.startswith('/'):
+                                # Use shopnow domain for product links
+                                if '/product' in href or '/products' in href:
+                                    source_url = f"https://shopnow.stewleonards.com{href}"
+                                else:
+                                    source_url = f"{self.BASE_URL}{href}"
+                            else:
+                                source_url = f"https://shopnow.stewleonards.com/{href}"
+                    
+                    # Extract image URL - try multiple strategies
+                    image_url = None
+                    img_elem = next((el for el, name, _ in tagged if name == 'img'), None)
+                    if img_elem:
+                        # Try multiple attributes in order of preference
+                        for attr in ['src', 'data-src', 'data-lazy-src', 'data-original', 'data-image']:
+                            image_url = img_elem.get(attr)
+                            if image_url:
+                                break
+                        
+                        if image_url:
+                            image_url = _absolute_image_url(image_url)
+                    
+                    # Fallback: look for image in link or parent containers
+                    if not image_url and link_elem:
+                        # Check if the product link has an image as a child
+                        link_img = link_elem.find('img')
+                        if link_img:
+                            for attr in ['src', 'data-src', 'data-lazy-src', 'data-original']:
+                                image_url = link_img.get(attr)
+                                if image_url:
+                                    break
+                            if image_url:
+                                image_url = _absolute_image_url(image_url)
+                    
+                    # Extract description - try multiple strategies
+                    description = self._extract_description(tagged, product_name, element_info)
+                    
+                    # Extract category (from collection/breadcrumb)
+                    category_id = None
+                    category_elem = _first_tagged(tagged, _CATEGORY_TAGS, _CATEGORY_CLASS_RE)
+                    if category_elem:
+                        category_name = category_elem.get_text(strip=True)
+                        if category_name:
+                            category_id = await self.get_or_create_category(category_name)
+                    
+                    # Extract unit and quantity
+                    unit, quantity = self.extract_unit_and_quantity(product_name, description or "")
+                    
+                    # Calculate discount (only if we have both prices and sale < regular)
+                    discount_percentage = self.calculate_discount(regular_price, sale_price)
+                    
+                    # Debug price extraction for first few items
+                    if self.debug and idx <= 5:
+                        print(f"      Item {idx} prices - Sale: {sale_price}, Regular: {regular_price}, Price elems found: {len(price_elems)}")
+                    
+                    if sale_price:  # Only create deal if we have a price
+                        deal = GroceryDeal(
+                            store_id=store.id,
+                            product_name=product_name,
+                            category_id=category_id,
+                            regular_price=regular_price,
+                            sale_price=sale_price,
+                            unit=unit,
+                            quantity=quantity,
+                            discount_percentage=discount_percentage,
+                            valid_from=valid_from,
+                            valid_to=valid_to,
+                            source_url=source_url,
+                            image_url=image_url,
+                            description=description
+                        )
+                        deals.append(deal)
+                        
+                except Exception as e:
+                    print(f"⚠️  Error parsing product item: {e}")
+                    continue
+            
+            print(f"✅ Found {len(deals)} deals in weekly specials")
+            
+        except Exception as e:
+            print(f"❌ Error scraping weekly specials: {e}")
+            if self.debug:
+                traceback.print_exc()
+        
+        return deals
+    
+    async def scrape_deals(self) -> List[GroceryDeal]:
+        """
+        Scrape deals from Stew Leonard's.
+        
+        Scrapes weekly specials from the provided URL or uses default Yonkers store page.
+        """
+        all_deals = []
+        
+        # Use specific_url if provided, otherwise use default Yonkers store page
+        url_to_scrape = self.specific_url or self.DEFAULT_STORE_URL
+        weekly_deals = await self.scrape_weekly_specials(url=url_to_scrape)
+        all_deals.extend(weekly_deals)
+        
+        # Remove duplicates based on product name and store_id, keeping the first occurrence
+        unique_deals = {}
+        for deal in all_deals:
+            unique_deals.setdefault((deal.product_name.strip().casefold(), deal.store_id), deal)
+        
+        return list(unique_deals.values())
+    
+    async def close(self):
+        """Close the Playwright browser and the HTTP client."""
+        try:
+            await self._close_browser()
+        finally:
+            await self.client.aclose()
+
+
+async def main():
+    """Main entry point for Stew Leonard's scraper."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Scrape Stew Leonard\'s weekly specials',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Use default Yonkers store page
+  python scripts/processing/scrape_stew_leonards.py
+  
+  # Use specific store location URL
+  python scripts/processing/scrape_stew_leonards.py --url "https://stewleonards.com/stew-leonards-locations/yonkers-store/"
+        """
+    )
+    parser.add_argument(
+        '--url',
+        type=str,
+        help='Specific store location URL to scrape (e.g., https://stewleonards.com/stew-leonards-locations/yonkers-store/)'
+    )
+    
+    args = parser.parse_args()
+    
+    # Create scraper with URL if provided
+    scraper = StewLeonardsScraper(url=args.url)
+    try:
+        if args.url:
+            # Scrape specific URL
+            print(f"🔍 Using provided URL: {args.url}")
+            deals = await scraper.scrape_weekly_specials(args.url)
+            saved_paths = await scraper.save_deals_to_json(deals)
+        else:
+            saved_paths = await scraper.run()
+        
+        print(f"\n✅ Scraping complete! Saved {len(saved_paths)} deals.")
+        return saved_paths
+    finally:
+        await scraper.close()
+
+
+if __name__ == '__main__':
+    run(main())
+
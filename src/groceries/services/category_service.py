@@ -1,23 +1,38 @@
 """Category service for database operations."""
 
-from typing import Optional
+from typing import Dict, Optional
 from ..database import get_pool
 from ..models.grocery import Category
 
 
+# Columns every category query returns, in the order _remember reads them
+CATEGORY_COLUMNS = 'id, name, parent_category_id, created_at, updated_at'
+
+
 class CategoryService:
     """Service for category database operations."""
     
+    # Process-local cache of resolved categories, keyed by name
+    _cache: Dict[str, Category] = {}
+    
     @staticmethod
     async def get_or_create_category(
         name: str,
         parent_category_id: Optional[int] = None,
         conn=None
     ) -> Optional[Category]:
-        """Get or create a category. If conn is provided, uses that connection."""
+        """Get or create a category. If conn is provided, uses that connection.
+        
+        Categories are cached per process once resolved, so repeated names
+        cost a single round-trip.
+        """
         if not name or not name.strip():
             return None
         
+        cached = CategoryService._cache.get(name)
+        if cached:
+            return cached
+        
         # Use provided connection or get new one
         if conn:
             return await CategoryService._get_or_create_category_with_conn(conn, name, parent_category_id)
@@ -35,24 +50,18 @@ class CategoryService:
         """Internal method to get or create category with a specific connection."""
         try:
             # First try to find existing category
-            query = "SELECT * FROM categories WHERE name = $1"
+            query = f"SELECT {CATEGORY_COLUMNS} FROM categories WHERE name = $1"
             row = await conn.fetchrow(query, name)
             
             if row:
-                return Category(
-                    id=row['id'],
-                    name=row['name'],
-                    parent_category_id=row['parent_category_id'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
+                return CategoryService._remember(row)
             
             # Create new category
-            query = """
+            query = f"""
                 INSERT INTO categories (name, parent_category_id)
                 VALUES ($1, $2)
                 ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
-                RETURNING *
+                RETURNING {CATEGORY_COLUMNS}
             """
             
             row = await conn.fetchrow(query, name, parent_category_id)
@@ -60,22 +69,51 @@ class CategoryService:
             if not row:
                 return None
             
-            return Category(
-                id=row['id'],
-                name=row['name'],
-                parent_category_id=row['parent_category_id'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
+            return CategoryService._remember(row)
         except Exception as e:
             print(f"Error in _get_or_create_category_with_conn '{name}': {str(e)}")
             return None
     
+    @staticmethod
+    def _remember(row) -> Category:
+        """Build a Category from a CATEGORY_COLUMNS row and cache it by name."""
+        category = Category(
+            id=row[0],
+            name=row[1],
+            parent_category_id=row[2],
+            created_at=row[3],
+            updated_at=row[4]
+        )
+        CategoryService._cache[category.name] = category
+        return category
+    
+    @staticmethod
+    async def prime_cache(conn=None) -> int:
+        """Load every category into the cache with a single query.
+        
+        Args:
+            conn: Optional connection to use instead of one from the pool
+        
+        Returns:
+            Number of categories cached
+        """
+        query = f"SELECT {CATEGORY_COLUMNS} FROM categories"
+        if conn:
+            rows = await conn.fetch(query)
+        else:
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(query)
+        
+        for row in rows:
+            CategoryService._remember(row)
+        return len(rows)
+    
     @staticmethod
     async def get_by_id(category_id: int) -> Optional[Category]:
         """Get category by ID."""
         pool = await get_pool()
-        query = "SELECT * FROM categories WHERE id = $1"
+        query = f"SELECT {CATEGORY_COLUMNS} FROM categories WHERE id = $1"
         
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query, category_id)
@@ -83,11 +121,4 @@ class CategoryService:
             if not row:
                 return None
             
-            return Category(
-                id=row['id'],
-                name=row['name'],
-                parent_category_id=row['parent_category_id'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-
+            return CategoryService._remember(row)
@@ -1,8 +1,11 @@
 """Grocery service for database operations."""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
 from ..database import get_pool
 from ..models.grocery import GroceryDeal, GroceryDealFilters, Store, Category
 from .store_service import StoreService
@@ -10,6 +13,108 @@ from .category_service import CategoryService
 from ..utils.uuid_utils import generate_grocery_deal_uuid
 
 
+# Column order used when inserting deals
+DEAL_INSERT_COLUMNS = (
+    'uuid', 'store_id', 'product_name', 'category_id', 'regular_price',
+    'sale_price', 'unit', 'quantity', 'discount_percentage',
+    'valid_from', 'valid_to', 'source_url', 'image_url', 'description'
+)
+
+# Builds the insert tuple for a deal in one C-level call
+_deal_record = attrgetter(*DEAL_INSERT_COLUMNS)
+
+# Session-local staging table bulk_create COPYs rows into
+DEAL_STAGING_TABLE = 'grocery_deals_staging'
+
+DEAL_STAGING_CREATE_QUERY = f"""
+    CREATE TEMP TABLE {DEAL_STAGING_TABLE} ON COMMIT DROP AS
+    SELECT {', '.join(DEAL_INSERT_COLUMNS)} FROM grocery_deals WITH NO DATA
+"""
+
+DEAL_STAGING_INSERT_QUERY = f"""
+    INSERT INTO grocery_deals ({', '.join(DEAL_INSERT_COLUMNS)})
+    SELECT {', '.join(DEAL_INSERT_COLUMNS)} FROM {DEAL_STAGING_TABLE}
+    ON CONFLICT (uuid) DO NOTHING
+    RETURNING uuid
+"""
+
+# Deal columns in the order _map_db_row_to_deal unpacks them
+DEAL_COLUMNS = ('id',) + DEAL_INSERT_COLUMNS + ('created_at', 'updated_at')
+
+# Deals joined with their store and category, as _map_db_row_to_deal expects
+DEAL_SELECT_QUERY = f"""
+    SELECT
+        {', '.join(f'gd.{column}' for column in DEAL_COLUMNS)},
+        s.name as store_name,
+        s.location as store_location,
+        s.website as store_website,
+        c.name as category_name,
+        c.parent_category_id
+    FROM grocery_deals gd
+    LEFT JOIN stores s ON gd.store_id = s.id
+    LEFT JOIN categories c ON gd.category_id = c.id
+"""
+
+# Inserts one deal and returns it joined like DEAL_SELECT_QUERY, in one round trip
+DEAL_CREATE_QUERY = f"""
+    WITH inserted AS (
+        INSERT INTO grocery_deals ({', '.join(DEAL_INSERT_COLUMNS)})
+        VALUES ({', '.join(f'${i}' for i in range(1, len(DEAL_INSERT_COLUMNS) + 1))})
+        RETURNING *
+    )
+    SELECT
+        {', '.join(f'gd.{column}' for column in DEAL_COLUMNS)},
+        s.name as store_name,
+        s.location as store_location,
+        s.website as store_website,
+        c.name as category_name,
+        c.parent_category_id
+    FROM inserted gd
+    LEFT JOIN stores s ON gd.store_id = s.id
+    LEFT JOIN categories c ON gd.category_id = c.id
+"""
+
+# GroceryDealFilters fields and the condition each adds, in parameter order
+DEAL_FILTER_CLAUSES = (
+    ('store_id', 'gd.store_id = ${}'),
+    ('category_id', 'gd.category_id = ${}'),
+    ('min_discount_percentage', 'gd.discount_percentage >= ${}'),
+    ('max_sale_price', 'gd.sale_price <= ${}'),
+    ('min_sale_price', 'gd.sale_price >= ${}'),
+    ('valid_from', 'gd.valid_to >= ${}'),
+    ('valid_to', 'gd.valid_from <= ${}'),
+    ('product_name_search', "to_tsvector('english', gd.product_name) @@ plainto_tsquery('english', ${})"),
+)
+
+
+@lru_cache(maxsize=256)
+def _filtered_deals_query(active: tuple) -> str:
+    """Build the iter_all query for a tuple of active filter flags, once per combination."""
+    conditions = ['1=1']
+    for (_, clause), is_active in zip(DEAL_FILTER_CLAUSES, active, strict=True):
+        if is_active:
+            conditions.append(clause.format(len(conditions)))
+    param_count = len(conditions) - 1
+    return (
+        f"{DEAL_SELECT_QUERY} WHERE {' AND '.join(conditions)}"
+        f' ORDER BY gd.created_at DESC LIMIT ${param_count + 1} OFFSET ${param_count + 2}'
+    )
+
+
+# Decimal constants for discount percentages
+_HUNDRED = Decimal(100)
+_CENT = Decimal('0.01')
+
+# Rows fetched per round-trip when streaming deals through a cursor
+DEAL_CURSOR_PREFETCH = 100
+
+# Smallest batch bulk_create will give its own connection
+BULK_INSERT_SHARD_MIN_ROWS = 500
+
+# Connections bulk_create spreads large batches over
+BULK_INSERT_SHARDS = 4
+
+
 class GroceryService:
     """Service for grocery deal database operations."""
     
@@ -20,101 +125,105 @@ class GroceryService:
         
         try:
             async with pool.acquire() as conn:
-                async with conn.transaction():
-                    # Generate deterministic UUID if not already set
-                    if not deal.uuid:
-                        deal.uuid = generate_grocery_deal_uuid(
-                            deal.product_name,
-                            deal.store_id,
-                            deal.valid_from,
-                            deal.valid_to
-                        )
-                    
-                    # Calculate discount percentage if not provided
-                    if deal.discount_percentage is None and deal.regular_price and deal.sale_price:
-                        discount = ((deal.regular_price - deal.sale_price) / deal.regular_price) * 100
-                        deal.discount_percentage = Decimal(str(round(float(discount), 2)))
-                    
-                    # Insert the deal
-                    deal_query = """
-                        INSERT INTO grocery_deals (
-                            uuid, store_id, product_name, category_id, regular_price,
-                            sale_price, unit, quantity, discount_percentage,
-                            valid_from, valid_to, source_url, image_url, description
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                        RETURNING *
-                    """
-                    
-                    deal_values = [
-                        deal.uuid,
-                        deal.store_id,
-                        deal.product_name,
-                        deal.category_id,
-                        deal.regular_price,
-                        deal.sale_price,
-                        deal.unit,
-                        deal.quantity,
-                        deal.discount_percentage,
-                        deal.valid_from,
-                        deal.valid_to,
-                        deal.source_url,
-                        deal.image_url,
-                        deal.description
-                    ]
-                    
-                    try:
-                        deal_row = await conn.fetchrow(deal_query, *deal_values)
-                    except Exception as insert_error:
-                        error_msg = str(insert_error)
-                        # Check if it's a duplicate UUID error
-                        if 'duplicate key' in error_msg.lower() and 'uuid' in error_msg.lower():
-                            print(f"Warning: Deal '{deal.product_name[:50]}' has duplicate UUID {deal.uuid}. Skipping.")
-                            # Try to fetch existing deal with this UUID
-                            existing = await conn.fetchrow('SELECT * FROM grocery_deals WHERE uuid = $1', deal.uuid)
-                            if existing:
-                                print(f"  Existing deal: '{existing['product_name'][:50]}' (ID: {existing['id']})")
-                        else:
-                            print(f"Error: Failed to insert deal '{deal.product_name[:50]}': {type(insert_error).__name__}: {error_msg}")
-                        return None
-                    
-                    if not deal_row:
-                        print(f"Error: Deal insert succeeded but returned no row for '{deal.product_name[:50]}'")
-                        return None
-                    
-                    deal_id = deal_row['id']
-            
-            # Transaction is now committed - fetch the complete deal
-            created_deal = await GroceryService.get_by_id(deal_id)
-            if not created_deal:
-                print(f"Warning: Deal {deal_id} created but couldn't fetch it back")
-                deal.id = deal_id
-                return deal
-            
-            return created_deal
+                GroceryService._prepare_deal(deal)
+                
+                try:
+                    deal_row = await conn.fetchrow(DEAL_CREATE_QUERY, *_deal_record(deal))
+                except Exception as insert_error:
+                    error_msg = str(insert_error)
+                    # Check if it's a duplicate UUID error
+                    if 'duplicate key' in error_msg.lower() and 'uuid' in error_msg.lower():
+                        print(f"Warning: Deal '{deal.product_name[:50]}' has duplicate UUID {deal.uuid}. Skipping.")
+                        # Try to fetch existing deal with this UUID
+                        existing = await conn.fetchrow('SELECT * FROM grocery_deals WHERE uuid = $1', deal.uuid)
+                        if existing:
+                            print(f"  Existing deal: '{existing['product_name'][:50]}' (ID: {existing['id']})")
+                    else:
+                        print(f"Error: Failed to insert deal '{deal.product_name[:50]}': {type(insert_error).__name__}: {error_msg}")
+                    return None
+                
+                if not deal_row:
+                    print(f"Error: Deal insert succeeded but returned no row for '{deal.product_name[:50]}'")
+                    return None
+                
+                return GroceryService._map_db_row_to_deal(deal_row)
         except Exception as e:
             import traceback
             print(f"Error creating deal '{deal.product_name[:50] if deal.product_name else 'No name'}': {type(e).__name__}: {str(e)}")
             print(f"Traceback: {traceback.format_exc()}")
             return None
     
+    @staticmethod
+    async def bulk_create(
+        deals: List[GroceryDeal],
+        min_shard_rows: int = BULK_INSERT_SHARD_MIN_ROWS,
+        shards: int = BULK_INSERT_SHARDS
+    ) -> Tuple[List[str], Dict[str, BaseException]]:
+        """Insert many deals, skipping duplicate UUIDs.
+        
+        Rows are deduplicated by UUID and split into shards by UUID hash, so
+        concurrent shards never touch the same key. Each shard is inserted on
+        its own pool connection and in its own transaction: it is streamed
+        into a temporary staging table with COPY and then moved into
+        grocery_deals with a single INSERT ... ON CONFLICT DO NOTHING, so a
+        shard costs a fixed number of round-trips whatever its size. A shard
+        that fails rolls back alone; the others still commit.
+        
+        Args:
+            deals: Deals to insert
+            min_shard_rows: Smallest number of rows worth a connection of its own
+            shards: Maximum number of connections used concurrently
+        
+        Returns:
+            UUIDs of the deals that were actually inserted, and the UUIDs of
+            deals in failed shards mapped to their shard's error
+        """
+        if not deals:
+            return [], {}
+        
+        for deal in deals:
+            GroceryService._prepare_deal(deal)
+        records = list({deal.uuid: _deal_record(deal) for deal in deals}.values())
+        
+        pool = await get_pool()
+        
+        # Small batches are not worth spreading over several connections
+        shard_count = max(1, min(shards, pool.get_max_size(), len(records) // min_shard_rows))
+        shard_records: List[List[tuple]] = [[] for _ in range(shard_count)]
+        for record in records:
+            shard_records[hash(record[0]) % shard_count].append(record)
+        shard_records = [shard for shard in shard_records if shard]
+        
+        async def insert_shard(shard: List[tuple]) -> List[str]:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(DEAL_STAGING_CREATE_QUERY)
+                    await conn.copy_records_to_table(
+                        DEAL_STAGING_TABLE, records=shard, columns=DEAL_INSERT_COLUMNS
+                    )
+                    rows = await conn.fetch(DEAL_STAGING_INSERT_QUERY)
+            return [str(row['uuid']) for row in rows]
+        
+        results = await asyncio.gather(
+            *(insert_shard(shard) for shard in shard_records),
+            return_exceptions=True
+        )
+        
+        inserted: List[str] = []
+        failed: Dict[str, BaseException] = {}
+        for shard, result in zip(shard_records, results, strict=True):
+            if isinstance(result, BaseException):
+                failed.update((record[0], result) for record in shard)
+            else:
+                inserted.extend(result)
+        return inserted, failed
+    
     @staticmethod
     async def get_by_id(deal_id: int) -> Optional[GroceryDeal]:
         """Get deal by ID."""
         pool = await get_pool()
         
-        query = """
-            SELECT 
-                gd.*,
-                s.name as store_name,
-                s.location as store_location,
-                s.website as store_website,
-                c.name as category_name,
-                c.parent_category_id
-            FROM grocery_deals gd
-            LEFT JOIN stores s ON gd.store_id = s.id
-            LEFT JOIN categories c ON gd.category_id = c.id
-            WHERE gd.id = $1
-        """
+        query = DEAL_SELECT_QUERY + ' WHERE gd.id = $1'
         
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query, deal_id)
@@ -129,19 +238,7 @@ class GroceryService:
         """Get deal by UUID."""
         pool = await get_pool()
         
-        query = """
-            SELECT 
-                gd.*,
-                s.name as store_name,
-                s.location as store_location,
-                s.website as store_website,
-                c.name as category_name,
-                c.parent_category_id
-            FROM grocery_deals gd
-            LEFT JOIN stores s ON gd.store_id = s.id
-            LEFT JOIN categories c ON gd.category_id = c.id
-            WHERE gd.uuid = $1
-        """
+        query = DEAL_SELECT_QUERY + ' WHERE gd.uuid = $1'
         
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query, uuid)
@@ -154,120 +251,47 @@ class GroceryService:
     @staticmethod
     async def get_all(filters: Optional[GroceryDealFilters] = None, limit: int = 50, offset: int = 0) -> List[GroceryDeal]:
         """Get all deals with optional filtering."""
-        pool = await get_pool()
-        
-        base_query = 'SELECT DISTINCT gd.id, gd.created_at FROM grocery_deals gd WHERE 1=1'
-        values = []
-        param_count = 0
+        return [deal async for deal in GroceryService.iter_all(filters, limit, offset)]
+    
+    @staticmethod
+    async def iter_all(
+        filters: Optional[GroceryDealFilters] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> AsyncIterator[GroceryDeal]:
+        """Stream deals with optional filtering, newest first.
         
-        if filters:
-            if filters.store_id:
-                param_count += 1
-                base_query += f' AND gd.store_id = ${param_count}'
-                values.append(filters.store_id)
-            
-            if filters.category_id:
-                param_count += 1
-                base_query += f' AND gd.category_id = ${param_count}'
-                values.append(filters.category_id)
-            
-            if filters.min_discount_percentage:
-                param_count += 1
-                base_query += f' AND gd.discount_percentage >= ${param_count}'
-                values.append(filters.min_discount_percentage)
-            
-            if filters.max_sale_price:
-                param_count += 1
-                base_query += f' AND gd.sale_price <= ${param_count}'
-                values.append(filters.max_sale_price)
-            
-            if filters.min_sale_price:
-                param_count += 1
-                base_query += f' AND gd.sale_price >= ${param_count}'
-                values.append(filters.min_sale_price)
-            
-            if filters.valid_from:
-                param_count += 1
-                base_query += f' AND gd.valid_to >= ${param_count}'
-                values.append(filters.valid_from)
-            
-            if filters.valid_to:
-                param_count += 1
-                base_query += f' AND gd.valid_from <= ${param_count}'
-                values.append(filters.valid_to)
-            
-            if filters.product_name_search:
-                param_count += 1
-                base_query += f" AND to_tsvector('english', gd.product_name) @@ plainto_tsquery('english', ${param_count})"
-                values.append(filters.product_name_search)
+        Deals are fetched with their store and category in a single query
+        and read through a server-side cursor, so callers can handle each
+        deal as it arrives instead of waiting for the whole page.
+        """
+        pool = await get_pool()
         
-        base_query += f' ORDER BY gd.created_at DESC LIMIT ${param_count + 1} OFFSET ${param_count + 2}'
+        # Only filters that are set (and truthy) take part, as before
+        filter_values = [getattr(filters, field) if filters else None for field, _ in DEAL_FILTER_CLAUSES]
+        query = _filtered_deals_query(tuple(bool(value) for value in filter_values))
+        values = [value for value in filter_values if value]
         values.extend([limit, offset])
         
-        # Get deal IDs first
         async with pool.acquire() as conn:
-            deal_ids_result = await conn.fetch(base_query, *values)
-            deal_ids = [row['id'] for row in deal_ids_result]
-            
-            if not deal_ids:
-                return []
-            
-            # Now fetch full deals
-            query = """
-                SELECT 
-                    gd.*,
-                    s.name as store_name,
-                    s.location as store_location,
-                    s.website as store_website,
-                    c.name as category_name,
-                    c.parent_category_id
-                FROM grocery_deals gd
-                LEFT JOIN stores s ON gd.store_id = s.id
-                LEFT JOIN categories c ON gd.category_id = c.id
-                WHERE gd.id = ANY($1)
-                ORDER BY gd.created_at DESC
-            """
-            
-            rows = await conn.fetch(query, deal_ids)
-            
-            return [GroceryService._map_db_row_to_deal(row) for row in rows]
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(query, *values, prefetch=DEAL_CURSOR_PREFETCH):
+                    yield GroceryService._map_db_row_to_deal(row)
     
     @staticmethod
     async def search(search_term: str, limit: int = 50) -> List[GroceryDeal]:
-        """Search deals by product name."""
+        """Search deals by product name and description, best match first."""
         pool = await get_pool()
         
-        # First get deal IDs that match the search
-        deal_ids_query = """
-            SELECT DISTINCT gd.id FROM grocery_deals gd 
+        query = DEAL_SELECT_QUERY + """
             WHERE to_tsvector('english', gd.product_name || ' ' || COALESCE(gd.description, '')) @@ plainto_tsquery('english', $1)
             ORDER BY ts_rank(to_tsvector('english', gd.product_name || ' ' || COALESCE(gd.description, '')), plainto_tsquery('english', $1)) DESC
             LIMIT $2
         """
         
         async with pool.acquire() as conn:
-            deal_ids_result = await conn.fetch(deal_ids_query, search_term, limit)
-            deal_ids = [row['id'] for row in deal_ids_result]
-            
-            if not deal_ids:
-                return []
-            
-            # Now fetch full deals
-            query = """
-                SELECT 
-                    gd.*,
-                    s.name as store_name,
-                    s.location as store_location,
-                    s.website as store_website,
-                    c.name as category_name,
-                    c.parent_category_id
-                FROM grocery_deals gd
-                LEFT JOIN stores s ON gd.store_id = s.id
-                LEFT JOIN categories c ON gd.category_id = c.id
-                WHERE gd.id = ANY($1)
-            """
-            
-            rows = await conn.fetch(query, deal_ids)
+            rows = await conn.fetch(query, search_term, limit)
             
             return [GroceryService._map_db_row_to_deal(row) for row in rows]
     
@@ -290,46 +314,81 @@ class GroceryService:
         
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query)
-            return dict(row)
+            return {
+                'total_deals': row[0],
+                'unique_stores': row[1],
+                'unique_categories': row[2],
+                'avg_discount': row[3],
+                'avg_sale_price': row[4],
+                'earliest_deal': row[5],
+                'latest_deal': row[6]
+            }
+    
+    @staticmethod
+    def _prepare_deal(deal: GroceryDeal) -> None:
+        """Fill in the UUID and discount percentage before a deal is inserted."""
+        # Generate deterministic UUID if not already set
+        if not deal.uuid:
+            deal.uuid = generate_grocery_deal_uuid(
+                deal.product_name,
+                deal.store_id,
+                deal.valid_from,
+                deal.valid_to
+            )
+        
+        # Calculate discount percentage if not provided
+        if deal.discount_percentage is None and deal.regular_price and deal.sale_price:
+            discount = (deal.regular_price - deal.sale_price) * _HUNDRED / deal.regular_price
+            deal.discount_percentage = discount.quantize(_CENT)
     
     @staticmethod
     def _map_db_row_to_deal(row: Any) -> GroceryDeal:
-        """Helper method to map database row to GroceryDeal object."""
+        """Helper method to map database row to GroceryDeal object.
+        
+        Rows come from DEAL_SELECT_QUERY, so they are unpacked by position.
+        """
+        (
+            deal_id, uuid, store_id, product_name, category_id, regular_price,
+            sale_price, unit, quantity, discount_percentage, valid_from, valid_to,
+            source_url, image_url, description, created_at, updated_at,
+            store_name, store_location, store_website, category_name, parent_category_id
+        ) = row
+        
         deal = GroceryDeal(
-            id=row['id'],
-            uuid=str(row['uuid']),
-            store_id=row['store_id'],
-            product_name=row['product_name'],
-            category_id=row['category_id'],
-            regular_price=row['regular_price'],
-            sale_price=row['sale_price'],
-            unit=row['unit'],
-            quantity=row['quantity'],
-            discount_percentage=row['discount_percentage'],
-            valid_from=row['valid_from'],
-            valid_to=row['valid_to'],
-            source_url=row['source_url'],
-            image_url=row['image_url'],
-            description=row['description'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
+            id=deal_id,
+            uuid=str(uuid),
+            store_id=store_id,
+            product_name=product_name,
+            category_id=category_id,
+            regular_price=regular_price,
+            sale_price=sale_price,
+            unit=unit,
+            quantity=quantity,
+            discount_percentage=discount_percentage,
+            valid_from=valid_from,
+            valid_to=valid_to,
+            source_url=source_url,
+            image_url=image_url,
+            description=description,
+            created_at=created_at,
+            updated_at=updated_at
         )
         
         # Add populated store data if available
-        if row['store_name']:
+        if store_name:
             deal.store = Store(
-                id=row['store_id'],
-                name=row['store_name'],
-                location=row['store_location'],
-                website=row['store_website']
+                id=store_id,
+                name=store_name,
+                location=store_location,
+                website=store_website
             )
         
         # Add populated category data if available
-        if row['category_name']:
+        if category_name:
             deal.category = Category(
-                id=row['category_id'],
-                name=row['category_name'],
-                parent_category_id=row['parent_category_id']
+                id=category_id,
+                name=category_name,
+                parent_category_id=parent_category_id
             )
         
         return deal
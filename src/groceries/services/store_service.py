@@ -1,13 +1,53 @@
 """Store service for database operations."""
 
-from typing import Optional
+from typing import Dict, Optional
 from ..database import get_pool
 from ..models.grocery import Store
 
 
+# Existing stores are read first, so the insert below only runs (and draws an id
+# from the stores sequence) for names not in the table yet
+STORE_SELECT_BY_NAME_QUERY = "SELECT * FROM stores WHERE name = $1"
+
+# Insert-or-fetch in one round trip; DO NOTHING keeps the updated_at trigger quiet
+STORE_GET_OR_CREATE_QUERY = """
+    WITH inserted AS (
+        INSERT INTO stores (name, location, website)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (name) DO NOTHING
+        RETURNING *
+    )
+    SELECT * FROM inserted
+    UNION ALL
+    SELECT * FROM stores WHERE name = $1
+    LIMIT 1
+"""
+
+# Fallback when a concurrent insert is invisible to the query above's snapshot
+STORE_UPSERT_QUERY = """
+    INSERT INTO stores (name, location, website)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+    RETURNING *
+"""
+
+# One static statement for every update_store call; NULL keeps the current value
+STORE_UPDATE_QUERY = """
+    UPDATE stores
+    SET name = COALESCE($1, name),
+        location = COALESCE($2, location),
+        website = COALESCE($3, website)
+    WHERE id = $4
+    RETURNING *
+"""
+
+
 class StoreService:
     """Service for store database operations."""
     
+    # Process-local cache of resolved stores, keyed by name
+    _cache: Dict[str, Store] = {}
+    
     @staticmethod
     async def get_or_create_store(
         name: str,
@@ -15,10 +55,18 @@ class StoreService:
         website: Optional[str] = None,
         conn=None
     ) -> Optional[Store]:
-        """Get or create a store. If conn is provided, uses that connection."""
+        """Get or create a store. If conn is provided, uses that connection.
+        
+        Stores are cached per process once resolved, so repeated names cost
+        a single round-trip.
+        """
         if not name or not name.strip():
             return None
         
+        cached = StoreService._cache.get(name)
+        if cached:
+            return cached
+        
         # Use provided connection or get new one
         if conn:
             return await StoreService._get_or_create_store_with_conn(conn, name, location, website)
@@ -35,45 +83,40 @@ class StoreService:
     async def _get_or_create_store_with_conn(conn, name: str, location: Optional[str], website: Optional[str]) -> Optional[Store]:
         """Internal method to get or create store with a specific connection."""
         try:
-            # First try to find existing store
-            query = "SELECT * FROM stores WHERE name = $1"
-            row = await conn.fetchrow(query, name)
+            row = await conn.fetchrow(STORE_SELECT_BY_NAME_QUERY, name)
             
-            if row:
-                return Store(
-                    id=row['id'],
-                    name=row['name'],
-                    location=row['location'],
-                    website=row['website'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-            
-            # Create new store
-            query = """
-                INSERT INTO stores (name, location, website)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
-                RETURNING *
-            """
+            if not row:
+                row = await conn.fetchrow(STORE_GET_OR_CREATE_QUERY, name, location, website)
             
-            row = await conn.fetchrow(query, name, location, website)
+            if not row:
+                row = await conn.fetchrow(STORE_UPSERT_QUERY, name, location, website)
             
             if not row:
                 return None
             
-            return Store(
-                id=row['id'],
-                name=row['name'],
-                location=row['location'],
-                website=row['website'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
+            return StoreService._remember(row)
         except Exception as e:
             print(f"Error in _get_or_create_store_with_conn '{name}': {str(e)}")
             return None
     
+    @staticmethod
+    def _remember(row) -> Store:
+        """Build a Store from a database row and cache it by name."""
+        store = Store(
+            id=row['id'],
+            name=row['name'],
+            location=row['location'],
+            website=row['website'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+        # A renamed store must not stay reachable under its old name
+        for cached_name, cached in list(StoreService._cache.items()):
+            if cached.id == store.id and cached_name != store.name:
+                del StoreService._cache[cached_name]
+        StoreService._cache[store.name] = store
+        return store
+    
     @staticmethod
     async def get_by_id(store_id: int) -> Optional[Store]:
         """Get store by ID."""
@@ -86,14 +129,21 @@ class StoreService:
             if not row:
                 return None
             
-            return Store(
-                id=row['id'],
-                name=row['name'],
-                location=row['location'],
-                website=row['website'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
+            return StoreService._remember(row)
+    
+    @staticmethod
+    async def get_by_name(name: str) -> Optional[Store]:
+        """Get store by exact name."""
+        pool = await get_pool()
+        query = "SELECT * FROM stores WHERE name = $1"
+        
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(query, name)
+            
+            if not row:
+                return None
+            
+            return StoreService._remember(row)
     
     @staticmethod
     async def update_store(
@@ -105,52 +155,15 @@ class StoreService:
         """Update store information."""
         pool = await get_pool()
         
-        # Build update query dynamically based on provided fields
-        updates = []
-        params = []
-        param_num = 1
-        
-        if name is not None:
-            updates.append(f"name = ${param_num}")
-            params.append(name)
-            param_num += 1
-        
-        if location is not None:
-            updates.append(f"location = ${param_num}")
-            params.append(location)
-            param_num += 1
-        
-        if website is not None:
-            updates.append(f"website = ${param_num}")
-            params.append(website)
-            param_num += 1
-        
-        if not updates:
+        if name is None and location is None and website is None:
             # No updates provided, just return the current store
             return await StoreService.get_by_id(store_id)
         
-        # Add store_id as the last parameter
-        params.append(store_id)
-        
-        query = f"""
-            UPDATE stores
-            SET {', '.join(updates)}
-            WHERE id = ${param_num}
-            RETURNING *
-        """
-        
         async with pool.acquire() as conn:
-            row = await conn.fetchrow(query, *params)
+            row = await conn.fetchrow(STORE_UPDATE_QUERY, name, location, website, store_id)
             
             if not row:
                 return None
             
-            return Store(
-                id=row['id'],
-                name=row['name'],
-                location=row['location'],
-                website=row['website'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
+            return StoreService._remember(row)
 
@@ -1,6 +1,22 @@
 """Grocery utilities."""
 
-from .uuid_utils import generate_grocery_deal_uuid
-from .json_processor import JSONProcessor
+from importlib import import_module
 
-__all__ = ['generate_grocery_deal_uuid', 'JSONProcessor']
+# Exports are imported on first access, so light helpers like run() don't
+# drag in pydantic and the models through JSONProcessor
+_EXPORTS = {
+    'generate_grocery_deal_uuid': '.uuid_utils',
+    'JSONProcessor': '.json_processor',
+    'DealWriter': '.deal_writer',
+    'LoadLedger': '.load_ledger',
+    'run': '.event_loop',
+}
+
+__all__ = ['generate_grocery_deal_uuid', 'JSONProcessor', 'DealWriter', 'LoadLedger', 'run']
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
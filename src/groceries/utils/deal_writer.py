@@ -0,0 +1,88 @@
+"""Background writer for saving scraped deals to JSON files."""
+
+import asyncio
+from typing import List, Optional
+from ..models.grocery import GroceryDeal
+from .json_processor import JSONProcessor
+
+
+class DealWriter:
+    """Queue deals for saving and write them to disk from a background task.
+    
+    Deals are drained from the queue in batches and each batch is
+    serialized and written in a worker thread, so producers only pay for
+    a queue put.
+    
+    Example:
+        writer = DealWriter('hmart')
+        for deal in deals:
+            await writer.put(deal)
+        saved_paths = await writer.close()
+    """
+    
+    def __init__(
+        self,
+        subdirectory: Optional[str] = None,
+        batch_size: int = 32,
+        maxsize: int = 1024
+    ):
+        """
+        Initialize the writer.
+        
+        Args:
+            subdirectory: Optional subdirectory within data/stage/ for output
+            batch_size: Maximum number of deals written per worker-thread call
+            maxsize: Maximum number of deals waiting in the queue
+        """
+        self.subdirectory = subdirectory
+        self.batch_size = batch_size
+        self.saved_paths: List[str] = []
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+    
+    async def put(self, deal: GroceryDeal):
+        """Queue a deal to be written, starting the writer task if needed."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+        await self._queue.put(deal)
+    
+    async def close(self) -> List[str]:
+        """
+        Wait for all queued deals to be written and stop the writer.
+        
+        Returns:
+            List of file paths where deals were saved
+        """
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+        return self.saved_paths
+    
+    async def _flush_loop(self):
+        """Drain the queue in batches until a None sentinel is received."""
+        done = False
+        while not done:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            if batch[-1] is None:
+                batch.pop()
+                done = True
+            
+            if batch:
+                self.saved_paths.extend(await asyncio.to_thread(self._write_batch, batch))
+    
+    def _write_batch(self, deals: List[GroceryDeal]) -> List[str]:
+        """Serialize and write a batch of deals (runs in a worker thread)."""
+        paths = []
+        for deal in deals:
+            try:
+                path, payload = JSONProcessor.build_deal_json(deal, self.subdirectory)
+                with open(path, 'wb') as file:
+                    file.write(payload)
+                paths.append(path)
+            except Exception as e:
+                print(f"❌ Error saving deal {deal.product_name[:50]}: {e}")
+        return paths
@@ -0,0 +1,22 @@
+"""Event loop helpers for async entry points."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+T = TypeVar('T')
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Drop-in replacement for asyncio.run() in script and CLI entry points.
+    """
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
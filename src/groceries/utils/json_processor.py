@@ -1,15 +1,29 @@
 """JSON processing utilities."""
 
-import json
+import asyncio
 import os
-from typing import Dict, Any, Optional
-from datetime import date
-from decimal import Decimal
-import aiofiles
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import orjson
+from pydantic_core import to_json
 from ..models.grocery import GroceryDeal
 from ..utils.uuid_utils import generate_grocery_deal_uuid
 
 
+async def read_file_bytes(path: str) -> bytes:
+    """Read a whole file in a worker thread, keeping the event loop free.
+    
+    One thread hop per file, rather than one each for open, read and close.
+    """
+    return await asyncio.to_thread(Path(path).read_bytes)
+
+
+async def write_file_bytes(path: str, data: bytes) -> None:
+    """Write a whole file in a worker thread, keeping the event loop free."""
+    await asyncio.to_thread(Path(path).write_bytes, data)
+
+
 class JSONProcessor:
     """JSON processor for grocery deal data."""
     
@@ -27,6 +41,28 @@ class JSONProcessor:
         Returns:
             Path to the saved JSON file
         """
+        output_path, payload = self.build_deal_json(deal, subdirectory)
+        
+        await write_file_bytes(output_path, payload)
+        
+        return output_path
+    
+    @staticmethod
+    def build_deal_json(
+        deal: GroceryDeal,
+        subdirectory: Optional[str] = None
+    ) -> Tuple[str, bytes]:
+        """Build the output path and indented JSON bytes for a deal.
+        
+        Creates the output directory if needed.
+        
+        Args:
+            deal: GroceryDeal object containing deal data
+            subdirectory: Optional subdirectory within data/stage/
+        
+        Returns:
+            Tuple of (output path, JSON bytes)
+        """
         # Create output directory if it doesn't exist
         if subdirectory:
             output_dir = os.path.join("data/stage", subdirectory)
@@ -35,33 +71,59 @@ class JSONProcessor:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        # Convert to dict first
-        deal_dict = deal.model_dump(mode='json')
+        payload = JSONProcessor.deal_to_json(deal)
+        
+        # Use UUID as filename
+        output_filename = f"{deal.uuid}.json"
+        return os.path.join(output_dir, output_filename), payload
+    
+    @staticmethod
+    def deal_to_json(deal: GroceryDeal, indent: bool = True) -> bytes:
+        """Serialize a deal to JSON bytes, filling in its deterministic UUID.
+        
+        pydantic-core writes the bytes directly, without an intermediate dict.
         
+        Args:
+            deal: GroceryDeal to serialize; its uuid is set if missing
+            indent: Indent with two spaces (per-deal files) or stay on one line (NDJSON)
+        """
         # Generate deterministic UUID if not already set
         if not deal.uuid:
-            uuid = generate_grocery_deal_uuid(
+            deal.uuid = generate_grocery_deal_uuid(
                 deal.product_name,
                 deal.store_id,
                 deal.valid_from,
                 deal.valid_to
             )
-            deal_dict['uuid'] = uuid
         
-        # Use UUID as filename
-        output_filename = f"{deal_dict['uuid']}.json"
-        output_path = os.path.join(output_dir, output_filename)
+        return to_json(deal, indent=2 if indent else None)
+    
+    async def save_deals_ndjson(
+        self,
+        deals: List[GroceryDeal],
+        subdirectory: Optional[str] = None
+    ) -> str:
+        """Save many deals to a single NDJSON file (one deal per line).
+        
+        Args:
+            deals: GroceryDeal objects to save
+            subdirectory: Optional subdirectory within data/stage/
+        
+        Returns:
+            Path to the saved NDJSON file
+        """
+        if subdirectory:
+            output_dir = os.path.join("data/stage", subdirectory)
+        else:
+            output_dir = "data/stage"
+        
+        os.makedirs(output_dir, exist_ok=True)
         
-        # Custom JSON encoder for Decimal and date objects
-        def json_serializer(obj):
-            if isinstance(obj, Decimal):
-                return float(obj)
-            if isinstance(obj, date):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        output_path = os.path.join(output_dir, f"deals-{timestamp}.ndjson")
         
-        async with aiofiles.open(output_path, 'w', encoding='utf-8') as file:
-            await file.write(json.dumps(deal_dict, indent=2, ensure_ascii=False, default=json_serializer))
+        content = b''.join(self.deal_to_json(deal, indent=False) + b'\n' for deal in deals)
+        await write_file_bytes(output_path, content)
         
         return output_path
     
@@ -71,9 +133,7 @@ class JSONProcessor:
             raise FileNotFoundError(f"JSON file not found: {json_file_path}")
         
         try:
-            async with aiofiles.open(json_file_path, 'r', encoding='utf-8') as file:
-                content = await file.read()
-                return json.loads(content)
+            return orjson.loads(await read_file_bytes(json_file_path))
         except Exception as e:
             raise Exception(f"Error loading JSON file: {str(e)}")
     
@@ -92,10 +152,10 @@ class JSONProcessor:
         if not os.path.exists(directory):
             raise FileNotFoundError(f"Directory not found: {directory}")
         
-        json_files = []
-        for filename in os.listdir(directory):
-            if filename.endswith('.json'):
-                json_files.append(os.path.join(directory, filename))
+        # DirEntry.path is built by scandir itself, so no per-file join
+        with os.scandir(directory) as entries:
+            json_files = [entry.path for entry in entries if entry.name.endswith('.json')]
         
-        return sorted(json_files)
+        json_files.sort()
+        return json_files
 
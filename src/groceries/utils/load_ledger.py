@@ -0,0 +1,66 @@
+"""Ledger of stage files that have already been loaded into the database."""
+
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List
+
+DEFAULT_LEDGER_PATH = "data/stage/.loaded.sqlite"
+
+
+class LoadLedger:
+    """SQLite-backed record of loaded files and their modification times.
+    
+    A file is skipped on later runs as long as its mtime is unchanged, so
+    the loader does not re-read and re-validate deals that are already in
+    the database. Rows are kept per target database, so loading into a
+    fresh or different database does not skip files.
+    """
+    
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH, *, database: str):
+        """
+        Open (or create) the ledger.
+        
+        Args:
+            path: Path to the SQLite database file
+            database: Name of the Postgres database the files are loaded into
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.database = database
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS loaded_files ('
+            'database TEXT NOT NULL, path TEXT NOT NULL, mtime REAL NOT NULL, '
+            'PRIMARY KEY (database, path))'
+        )
+        self._conn.commit()
+    
+    def loaded_files(self) -> Dict[str, float]:
+        """Return a mapping of absolute file path to recorded mtime for this database."""
+        return dict(self._conn.execute(
+            'SELECT path, mtime FROM loaded_files WHERE database = ?', (self.database,)
+        ))
+    
+    def iter_new(self, paths: Iterable[str]) -> Iterator[str]:
+        """Lazily yield the paths that are not recorded with their current mtime."""
+        loaded = self.loaded_files()
+        return (
+            path for path in paths
+            if loaded.get(os.path.abspath(path)) != os.path.getmtime(path)
+        )
+    
+    def filter_new(self, paths: Iterable[str]) -> List[str]:
+        """Return only the paths that are not recorded with their current mtime."""
+        return list(self.iter_new(paths))
+    
+    def mark_loaded(self, paths: Iterable[str]):
+        """Record paths as loaded with their current mtime."""
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO loaded_files (database, path, mtime) VALUES (?, ?, ?)',
+            ((self.database, os.path.abspath(path), os.path.getmtime(path)) for path in paths)
+        )
+        self._conn.commit()
+    
+    def close(self):
+        """Close the underlying SQLite connection."""
+        self._conn.close()
@@ -1,13 +1,20 @@
 """UUID utilities for grocery deal tracking."""
 
+import hashlib
 import uuid
 from datetime import date
+from functools import lru_cache
 
 
 # Namespace for grocery deal UUIDs (using DNS namespace as base)
 GROCERY_DEAL_UUID_NAMESPACE = uuid.UUID('6ba7b811-9dad-11d1-80b4-00c04fd430c8')
 
+# Namespace prefix of every uuid5 SHA-1 input, encoded once
+_GROCERY_DEAL_NAMESPACE_BYTES = GROCERY_DEAL_UUID_NAMESPACE.bytes
 
+
+# Pure function of hashable inputs, and reprocessing sees the same deals again
+@lru_cache(maxsize=65536)
 def generate_grocery_deal_uuid(
     product_name: str,
     store_id: int,
@@ -45,6 +52,7 @@ def generate_grocery_deal_uuid(
     # Create content string for UUID generation
     content = f"{normalized_product}:{store_id}:{valid_from}:{valid_to}"
     
-    # Generate deterministic UUID using uuid5
-    return str(uuid.uuid5(GROCERY_DEAL_UUID_NAMESPACE, content))
+    # Generate deterministic UUID using uuid5 (same bytes uuid.uuid5 hashes)
+    digest = hashlib.sha1(_GROCERY_DEAL_NAMESPACE_BYTES + content.encode('utf-8')).digest()
+    return str(uuid.UUID(bytes=digest[:16], version=5))
 
@@ -0,0 +1,24 @@
+"""Shared fixtures for unit tests."""
+
+from datetime import date
+from types import MappingProxyType
+import pytest
+
+from groceries.utils.uuid_utils import generate_grocery_deal_uuid
+
+
+@pytest.fixture(scope="session")
+def base_milk_kwargs():
+    """Read-only reference deal identity the UUID tests vary one field of."""
+    return MappingProxyType({
+        "product_name": "Organic Milk",
+        "store_id": 1,
+        "valid_from": date(2025, 1, 1),
+        "valid_to": date(2025, 1, 7),
+    })
+
+
+@pytest.fixture(scope="session")
+def base_milk_uuid(base_milk_kwargs):
+    """UUID of the reference deal, computed once per session."""
+    return generate_grocery_deal_uuid(**base_milk_kwargs)
@@ -0,0 +1,47 @@
+"""Tests for the background deal writer."""
+
+from pathlib import Path
+from datetime import date
+from decimal import Decimal
+import pytest
+
+from groceries.models.grocery import GroceryDeal
+from groceries.utils.deal_writer import DealWriter
+from groceries.utils.json_processor import JSONProcessor
+
+
+@pytest.mark.asyncio
+async def test_deal_writer_saves_all_deals(tmp_path, monkeypatch):
+    """Test that every queued deal is written before close() returns."""
+    # DealWriter writes under data/stage relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    writer = DealWriter(subdirectory="test_writer", batch_size=4)
+    
+    for idx in range(10):
+        await writer.put(GroceryDeal(
+            store_id=1,
+            product_name=f"Organic Milk {idx}",
+            sale_price=Decimal("4.99"),
+            valid_from=date(2025, 1, 1),
+            valid_to=date(2025, 1, 7)
+        ))
+    
+    saved_paths = await writer.close()
+    
+    assert len(saved_paths) == 10
+    assert len(set(saved_paths)) == 10
+    assert all(Path(path).resolve().is_relative_to(tmp_path) for path in saved_paths)
+    
+    # Files are readable by the regular JSON processor
+    loaded_data = await JSONProcessor().load_deal_json(saved_paths[0])
+    assert loaded_data['product_name'] == "Organic Milk 0"
+    assert loaded_data['sale_price'] == "4.99"
+    assert loaded_data['valid_from'] == "2025-01-01"
+
+
+@pytest.mark.asyncio
+async def test_deal_writer_close_without_deals(tmp_path, monkeypatch):
+    """Test closing a writer that never received a deal."""
+    monkeypatch.chdir(tmp_path)
+    writer = DealWriter(subdirectory="test_writer")
+    assert await writer.close() == []
@@ -0,0 +1,82 @@
+"""Tests for the grocery deal service."""
+
+from contextlib import asynccontextmanager
+from datetime import date
+import pytest
+
+from groceries.models.grocery import GroceryDeal
+from groceries.services import grocery_service
+from groceries.services.grocery_service import GroceryService
+
+
+class FakeConnection:
+    """Connection that records COPYed shards and fails on a poisoned product."""
+
+    def __init__(self, shards):
+        self.shards = shards
+        self.records = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query):
+        pass
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.records = records
+        self.shards.append([record[0] for record in records])
+        if any(record[2] == "poison" for record in records):
+            raise RuntimeError("shard failed")
+
+    async def fetch(self, query):
+        return [{'uuid': record[0]} for record in self.records]
+
+
+class FakePool:
+    """Pool handing out FakeConnections."""
+
+    def __init__(self):
+        self.shards = []
+
+    def get_max_size(self):
+        return 10
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self.shards)
+
+
+def make_deal(product_name):
+    return GroceryDeal(
+        store_id=1,
+        product_name=product_name,
+        valid_from=date(2025, 1, 1),
+        valid_to=date(2025, 1, 7)
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_shards_by_uuid_and_reports_failed_shards(monkeypatch):
+    """Test that duplicate UUIDs share one shard and a failed shard is reported per deal."""
+    pool = FakePool()
+
+    async def get_pool():
+        return pool
+
+    monkeypatch.setattr(grocery_service, "get_pool", get_pool)
+
+    # 50 distinct deals, each queued twice, plus one deal whose shard fails
+    deals = [make_deal(f"Product {idx % 50}") for idx in range(100)] + [make_deal("poison")]
+
+    inserted, failed = await GroceryService.bulk_create(deals, min_shard_rows=10, shards=4)
+
+    copied = [uuid for shard in pool.shards for uuid in shard]
+    assert 1 < len(pool.shards) <= 4
+    assert len(copied) == len(set(copied)) == 51
+
+    poison_uuid = deals[-1].uuid
+    assert poison_uuid in failed
+    assert all(str(error) == "shard failed" for error in failed.values())
+    assert not set(failed) & set(inserted)
+    assert len(inserted) + len(failed) == 51
@@ -1,6 +1,5 @@
 """Tests for JSON processor."""
 
-import sys
 import os
 import json
 from pathlib import Path
@@ -8,10 +7,6 @@ from datetime import date
 from decimal import Decimal
 import pytest
 
-# Add src to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / 'src'))
-
 from groceries.models.grocery import GroceryDeal
 from groceries.utils.json_processor import JSONProcessor
 
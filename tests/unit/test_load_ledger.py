@@ -0,0 +1,73 @@
+"""Tests for the load ledger."""
+
+import os
+
+from groceries.loaders.json_loader import _files_to_load
+from groceries.utils.load_ledger import LoadLedger
+
+
+def test_filter_new_skips_loaded_files(tmp_path):
+    """Test that loaded files are skipped until they change."""
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text("{}")
+    second.write_text("{}")
+    
+    ledger = LoadLedger(str(tmp_path / ".loaded.sqlite"), database="groceries")
+    assert ledger.filter_new([str(first), str(second)]) == [str(first), str(second)]
+    
+    ledger.mark_loaded([str(first)])
+    assert ledger.filter_new([str(first), str(second)]) == [str(second)]
+    
+    # A modified file is loaded again
+    os.utime(first, (0, 0))
+    assert ledger.filter_new([str(first), str(second)]) == [str(first), str(second)]
+    ledger.close()
+
+
+def test_ledger_persists_between_runs(tmp_path):
+    """Test that a reopened ledger remembers loaded files."""
+    deal_file = tmp_path / "deal.json"
+    deal_file.write_text("{}")
+    ledger_path = str(tmp_path / ".loaded.sqlite")
+    
+    ledger = LoadLedger(ledger_path, database="groceries")
+    ledger.mark_loaded([str(deal_file)])
+    ledger.close()
+    
+    ledger = LoadLedger(ledger_path, database="groceries")
+    assert ledger.filter_new([str(deal_file)]) == []
+    assert str(deal_file.resolve()) in ledger.loaded_files()
+    ledger.close()
+
+
+def test_limited_runs_work_through_unloaded_files(tmp_path):
+    """Test that --limit picks files the ledger has not seen yet."""
+    for idx in range(5):
+        (tmp_path / f"deal{idx}.json").write_text("{}")
+    ledger = LoadLedger(str(tmp_path / ".loaded.sqlite"), database="groceries")
+    
+    loaded = []
+    for _ in range(3):
+        batch = _files_to_load(str(tmp_path), dry_run=False, ledger=ledger, limit=2)
+        ledger.mark_loaded(batch)
+        loaded.extend(batch)
+    
+    assert sorted(loaded) == sorted(str(tmp_path / f"deal{idx}.json") for idx in range(5))
+    assert _files_to_load(str(tmp_path), dry_run=False, ledger=ledger, limit=2) == []
+    ledger.close()
+
+
+def test_ledger_is_kept_per_database(tmp_path):
+    """Test that files loaded into one database are not skipped for another."""
+    deal_file = tmp_path / "deal.json"
+    deal_file.write_text("{}")
+    ledger_path = str(tmp_path / ".loaded.sqlite")
+    
+    ledger = LoadLedger(ledger_path, database="groceries")
+    ledger.mark_loaded([str(deal_file)])
+    ledger.close()
+    
+    other = LoadLedger(ledger_path, database="groceries_test")
+    assert other.filter_new([str(deal_file)]) == [str(deal_file)]
+    other.close()
@@ -0,0 +1,39 @@
+"""Tests for Stew Leonard's scraper helpers."""
+
+import pytest
+
+from decimal import Decimal
+from groceries.scrapers.stew_leonards import StewLeonardsScraper, clean_product_name
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("/lb Save Chicken Breast", "Chicken Breast"),
+    ("/lbSaveBeef", "Beef"),
+    ("lb Save  Pork 2 lb", "Pork"),
+    ("LBSAVE Salmon $9.99/lb", "Salmon /lb"),
+    ("Save Milk 1 gal Save", "Milk gal"),
+    ("low carb Bread", "Bread"),
+    ("  - Eggs 12 ct", "Eggs"),
+    ("Current Price: $4.99 Cheese", "Cheese"),
+    ("Original price $5 Ham (est.)", "Ham"),
+    ("Grapes (Estimated) 3.49 per pound", "Grapes"),
+    ("Save 20% off Tuna", "% off Tuna"),
+    ("/LB Kiwi", "LB Kiwi"),
+])
+def test_clean_product_name(raw, expected):
+    """Test that badge prefixes, prices and artifacts are stripped."""
+    assert clean_product_name(raw) == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("$5.99", Decimal("5.99")),
+    ("5.99", Decimal("5.99")),
+    ("$799", Decimal("7.99")),
+    ("$1,299.00", Decimal("1299.00")),
+    ("$99", Decimal("99")),
+    ("Sale", None),
+    ("", None),
+])
+def test_parse_price(text, expected):
+    """Test price parsing, including the Shopify cents format."""
+    assert StewLeonardsScraper.parse_price(text) == expected
@@ -1,114 +1,62 @@
 """Tests for UUID utilities."""
 
-import sys
-from pathlib import Path
+import re
+import uuid
 from datetime import date
 import pytest
+from hypothesis import given, strategies as st
 
-# Add src to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+from groceries.utils.uuid_utils import GROCERY_DEAL_UUID_NAMESPACE, generate_grocery_deal_uuid
 
-from groceries.utils.uuid_utils import generate_grocery_deal_uuid
 
+# Canonical lowercase UUID string, checked in one pass
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
 
-def test_generate_grocery_deal_uuid():
+
+def test_generate_grocery_deal_uuid(base_milk_kwargs, base_milk_uuid):
     """Test UUID generation for grocery deals."""
-    uuid1 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
     # Should be a valid UUID string
-    assert isinstance(uuid1, str)
-    assert len(uuid1) == 36
-    assert uuid1.count('-') == 4
-    
-    # Same inputs should generate same UUID (deterministic)
-    uuid2 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
+    assert _UUID_RE.fullmatch(base_milk_uuid)
     
-    assert uuid1 == uuid2
+    # Same inputs should generate same UUID (deterministic), bypassing the cache
+    assert generate_grocery_deal_uuid.__wrapped__(**base_milk_kwargs) == base_milk_uuid
 
 
-def test_uuid_different_products():
-    """Test that different products generate different UUIDs."""
-    uuid1 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
-    uuid2 = generate_grocery_deal_uuid(
-        product_name="Organic Eggs",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
-    assert uuid1 != uuid2
+def test_uuid_is_pinned(base_milk_uuid):
+    """Test that the reference deal keeps the UUID already stored in the database."""
+    assert base_milk_uuid == '8b96b6ad-8ec7-5397-b24d-0823a3d52129'
 
 
-def test_uuid_different_stores():
-    """Test that different stores generate different UUIDs."""
-    uuid1 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
-    uuid2 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=2,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
+@given(product_name=st.text(min_size=1, max_size=40), store_id=st.integers(min_value=1, max_value=10_000))
+def test_uuid_matches_uuid5(base_milk_kwargs, product_name, store_id):
+    """Test that the inlined hash matches uuid.uuid5 over the same content."""
+    kwargs = {**base_milk_kwargs, "product_name": product_name, "store_id": store_id}
+    content = f"{product_name.strip().lower()}:{store_id}:{kwargs['valid_from']}:{kwargs['valid_to']}"
     
-    assert uuid1 != uuid2
+    expected = str(uuid.uuid5(GROCERY_DEAL_UUID_NAMESPACE, content))
+    assert generate_grocery_deal_uuid.__wrapped__(**kwargs) == expected
 
 
-def test_uuid_different_dates():
-    """Test that different dates generate different UUIDs."""
-    uuid1 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
-    uuid2 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 8),
-        valid_to=date(2025, 1, 14)
-    )
-    
-    assert uuid1 != uuid2
+@pytest.mark.parametrize("changes", [
+    pytest.param({"product_name": "Organic Eggs"}, id="different_products"),
+    pytest.param({"store_id": 2}, id="different_stores"),
+    pytest.param({"valid_from": date(2025, 1, 8), "valid_to": date(2025, 1, 14)}, id="different_dates"),
+])
+def test_uuid_differs(base_milk_kwargs, base_milk_uuid, changes):
+    """Test that changing the product, store or dates changes the UUID."""
+    assert generate_grocery_deal_uuid(**{**base_milk_kwargs, **changes}) != base_milk_uuid
 
 
-def test_uuid_case_insensitive():
+def test_uuid_case_insensitive(base_milk_kwargs, base_milk_uuid):
     """Test that UUID generation is case-insensitive for product names."""
-    uuid1 = generate_grocery_deal_uuid(
-        product_name="Organic Milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
-    
-    uuid2 = generate_grocery_deal_uuid(
-        product_name="organic milk",
-        store_id=1,
-        valid_from=date(2025, 1, 1),
-        valid_to=date(2025, 1, 7)
-    )
+    uuid2 = generate_grocery_deal_uuid(**{**base_milk_kwargs, "product_name": "organic milk"})
     
-    assert uuid1 == uuid2
+    assert uuid2 == base_milk_uuid
 
+
+@given(product_name=st.text(min_size=1, max_size=40), store_id=st.integers(min_value=1, max_value=10_000))
+def test_uuid_format_for_any_input(base_milk_kwargs, product_name, store_id):
+    """Test that any product name and store ID yields a canonical UUID string."""
+    uuid = generate_grocery_deal_uuid(**{**base_milk_kwargs, "product_name": product_name, "store_id": store_id})
+    
+    assert _UUID_RE.fullmatch(uuid)